@@ -3,27 +3,53 @@
 from typing import Annotated
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.schemas import CalculationRequest, CalculationResult, ErrorResponse
-from app.services.neo4j_service import Neo4jService, get_neo4j_service
-from app.services.calculation_service import CalculationService
+from app.services.calculation_service import (
+    CalculationService,
+    UnsupportedRelationshipError,
+    get_calculation_service,
+)
 
 router = APIRouter(prefix="/calculation", tags=["calculation"])
 
 
+def _run_calculation(calc_service: CalculationService, case_id: str) -> CalculationResult:
+    """相続計算を実行し、案件未検出・未対応の続柄をHTTPExceptionに変換
+
+    Args:
+        calc_service: 相続計算サービス
+        case_id: 案件ID
+
+    Returns:
+        CalculationResult: 計算結果
+
+    Raises:
+        HTTPException: 案件または被相続人が見つからない場合（404）、続柄が未対応の場合（500）
+    """
+    try:
+        return calc_service.calculate_inheritance(case_id)
+    except UnsupportedRelationshipError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"相続計算エラー: {str(e)}"
+        ) from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
 @router.post(
     "/calculate",
     response_model=CalculationResult,
-    responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
+    responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="相続計算実行",
     description="指定された案件の相続人と相続割合を計算します。",
 )
-async def calculate_inheritance(
-    request: CalculationRequest, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]
+def calculate_inheritance(
+    request: CalculationRequest, calc_service: Annotated[CalculationService, Depends(get_calculation_service)]
 ) -> CalculationResult:
     """相続計算実行
 
     Args:
         request: 計算リクエスト
-        neo4j: Neo4jサービス（DI）
+        calc_service: 相続計算サービス（DI）
 
     Returns:
         CalculationResult: 計算結果
@@ -31,38 +57,24 @@ async def calculate_inheritance(
     Raises:
         HTTPException: 計算エラー時
     """
-    try:
-        # 計算サービス初期化
-        calc_service = CalculationService(neo4j)
-
-        # 相続計算実行
-        result = calc_service.calculate_inheritance(request.case_id)
-
-        return result
-
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"相続計算エラー: {str(e)}"
-        ) from e
+    return _run_calculation(calc_service, request.case_id)
 
 
 @router.get(
     "/cases/{case_id}/calculate",
     response_model=CalculationResult,
-    responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
+    responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="相続計算実行（GETメソッド）",
     description="指定された案件IDの相続人と相続割合を計算します。",
 )
-async def calculate_inheritance_by_case_id(
-    case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]
+def calculate_inheritance_by_case_id(
+    case_id: str, calc_service: Annotated[CalculationService, Depends(get_calculation_service)]
 ) -> CalculationResult:
     """相続計算実行（GETメソッド）
 
     Args:
         case_id: 案件ID
-        neo4j: Neo4jサービス（DI）
+        calc_service: 相続計算サービス（DI）
 
     Returns:
         CalculationResult: 計算結果
@@ -70,18 +82,4 @@ async def calculate_inheritance_by_case_id(
     Raises:
         HTTPException: 計算エラー時
     """
-    try:
-        # 計算サービス初期化
-        calc_service = CalculationService(neo4j)
-
-        # 相続計算実行
-        result = calc_service.calculate_inheritance(case_id)
-
-        return result
-
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"相続計算エラー: {str(e)}"
-        ) from e
+    return _run_calculation(calc_service, case_id)
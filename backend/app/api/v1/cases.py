@@ -1,9 +1,9 @@
 """相続案件（Case）管理API"""
 
-import uuid
 from datetime import datetime
-from typing import Annotated
-from fastapi import APIRouter, HTTPException, status, Depends
+from secrets import token_hex
+from typing import Annotated, Any, Optional
+from fastapi import APIRouter, HTTPException, Query, status, Depends
 from app.schemas import (
     CaseCreate,
     CaseUpdate,
@@ -12,6 +12,7 @@ from app.schemas import (
     ErrorResponse,
     PersonCreate,
     PersonResponse,
+    PersonListAdapter,
     RelationshipCreate,
     FamilyTreeResponse,
 )
@@ -21,6 +22,64 @@ from app.services.era_converter import parse_japanese_date, EraConversionError
 router = APIRouter(prefix="/cases", tags=["cases"])
 
 
+def _to_native_datetime(value: Any) -> Any:
+    """Neo4jの日時型をPython標準のdatetimeに変換
+
+    Args:
+        value: Neo4jから取得した日時値
+
+    Returns:
+        Any: to_native()を持つ場合は変換後の値、それ以外はそのまま
+    """
+    to_native = getattr(value, "to_native", None)
+    return to_native() if to_native is not None else value
+
+
+def _build_case_response(case_node: dict[str, Any], decedent: Optional[dict[str, Any]]) -> CaseResponse:
+    """Case節点と被相続人節点からレスポンスを構築
+
+    値は自前で書き込んだNeo4j節点由来のため、バリデーションを省略して構築する。
+    （レスポンスはresponse_modelで改めて検証される）
+
+    Args:
+        case_node: Case節点
+        decedent: 被相続人節点（存在しない場合None）
+
+    Returns:
+        CaseResponse: 案件レスポンス
+    """
+    return CaseResponse.model_construct(
+        id=case_node["id"],
+        title=case_node["title"],
+        description=case_node.get("description"),
+        decedent_name=decedent["name"] if decedent else "",
+        death_date=decedent.get("death_date", "") if decedent else "",
+        status=case_node["status"],
+        created_at=_to_native_datetime(case_node["created_at"]),
+        updated_at=_to_native_datetime(case_node["updated_at"]),
+    )
+
+
+def _build_person_response(person_node: dict[str, Any]) -> PersonResponse:
+    """Person節点からレスポンスを構築
+
+    Args:
+        person_node: Person節点
+
+    Returns:
+        PersonResponse: 人物レスポンス
+    """
+    return PersonResponse.model_construct(
+        id=person_node["id"],
+        name=person_node["name"],
+        is_alive=person_node["is_alive"],
+        death_date=person_node.get("death_date"),
+        birth_date=person_node.get("birth_date"),
+        gender=person_node.get("gender"),
+        is_decedent=person_node["is_decedent"],
+    )
+
+
 @router.post(
     "/",
     response_model=CaseResponse,
@@ -29,7 +88,7 @@ router = APIRouter(prefix="/cases", tags=["cases"])
     summary="相続案件を作成",
     description="新しい相続案件を作成します。",
 )
-async def create_case(
+def create_case(
     case_data: CaseCreate, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]
 ) -> CaseResponse:
     """相続案件作成
@@ -44,86 +103,59 @@ async def create_case(
     Raises:
         HTTPException: 作成エラー時
     """
+    # 死亡日の妥当性検証（保存時は西暦ISO形式に正規化）
     try:
-        # 死亡日の妥当性検証
-        try:
-            parse_japanese_date(case_data.death_date)
-        except EraConversionError as e:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"死亡日の形式が不正: {str(e)}") from e
-
-        # 案件ID生成
-        case_id = f"case-{uuid.uuid4().hex[:12]}"
-
-        # Neo4jにCase節点作成
-        case_node = neo4j.create_case_node(case_id=case_id, title=case_data.title, description=case_data.description)
-
-        # 被相続人のPerson節点も作成
-        decedent_id = f"person-{uuid.uuid4().hex[:12]}"
-        neo4j.create_person_node(
-            person_id=decedent_id,
-            case_id=case_id,
-            name=case_data.decedent_name,
-            is_alive=False,
-            is_decedent=True,
-            death_date=case_data.death_date,
-        )
-
-        return CaseResponse(
-            id=case_node["id"],
-            title=case_node["title"],
-            description=case_node.get("description"),
-            decedent_name=case_data.decedent_name,
-            death_date=case_data.death_date,
-            status=case_node["status"],
-            created_at=case_node["created_at"],
-            updated_at=case_node["updated_at"],
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+        death_date = parse_japanese_date(case_data.death_date).isoformat()
+    except EraConversionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"死亡日の形式が不正: {str(e)}") from e
+
+    # 案件ID生成
+    case_id = f"case-{token_hex(6)}"
+
+    # Neo4jにCase節点作成
+    case_node = neo4j.create_case_node(case_id=case_id, title=case_data.title, description=case_data.description)
+
+    # 被相続人のPerson節点も作成
+    decedent_id = f"person-{token_hex(6)}"
+    neo4j.create_person_node(
+        person_id=decedent_id,
+        case_id=case_id,
+        name=case_data.decedent_name,
+        is_alive=False,
+        is_decedent=True,
+        death_date=death_date,
+    )
+
+    return _build_case_response(case_node, {"name": case_data.decedent_name, "death_date": death_date})
 
 
 @router.get(
     "/",
     response_model=CaseListResponse,
     summary="相続案件一覧取得",
-    description="全ての相続案件を取得します。",
+    description="相続案件を作成日時の新しい順に取得します。skip/limitでページングできます。",
 )
-async def list_cases(neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> CaseListResponse:
+def list_cases(
+    neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)],
+    skip: Annotated[int, Query(ge=0, description="読み飛ばす件数")] = 0,
+    limit: Annotated[int, Query(ge=1, le=500, description="取得する最大件数")] = 50,
+) -> CaseListResponse:
     """相続案件一覧取得
 
     Args:
         neo4j: Neo4jサービス（DI）
+        skip: 読み飛ばす件数
+        limit: 取得する最大件数
 
     Returns:
-        CaseListResponse: 案件一覧
+        CaseListResponse: 案件一覧（totalは全案件数）
     """
-    try:
-        case_nodes = neo4j.get_all_cases()
-
-        cases = []
-        for case_node in case_nodes:
-            # 被相続人情報を取得
-            persons = neo4j.get_persons_by_case(case_node["id"])
-            decedent = next((p for p in persons if p.get("is_decedent")), None)
-
-            cases.append(
-                CaseResponse(
-                    id=case_node["id"],
-                    title=case_node["title"],
-                    description=case_node.get("description"),
-                    decedent_name=decedent["name"] if decedent else "",
-                    death_date=decedent.get("death_date", "") if decedent else "",
-                    status=case_node["status"],
-                    created_at=case_node["created_at"],
-                    updated_at=case_node["updated_at"],
-                )
-            )
-
-        return CaseListResponse(cases=cases, total=len(cases))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # Case節点と被相続人情報を1回のクエリで取得
+    case_rows = neo4j.get_cases_with_decedent(skip=skip, limit=limit)
+
+    cases = [_build_case_response(case_node, decedent) for case_node, decedent in case_rows]
+
+    return CaseListResponse.model_construct(cases=cases, total=neo4j.count_cases())
 
 
 @router.get(
@@ -133,7 +165,7 @@ async def list_cases(neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)])
     summary="相続案件詳細取得",
     description="指定されたIDの相続案件を取得します。",
 )
-async def get_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> CaseResponse:
+def get_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> CaseResponse:
     """相続案件詳細取得
 
     Args:
@@ -146,29 +178,12 @@ async def get_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4
     Raises:
         HTTPException: 案件が見つからない場合
     """
-    try:
-        case_node = neo4j.get_case_by_id(case_id)
-        if not case_node:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
-
-        # 被相続人情報を取得
-        persons = neo4j.get_persons_by_case(case_id)
-        decedent = next((p for p in persons if p.get("is_decedent")), None)
-
-        return CaseResponse(
-            id=case_node["id"],
-            title=case_node["title"],
-            description=case_node.get("description"),
-            decedent_name=decedent["name"] if decedent else "",
-            death_date=decedent.get("death_date", "") if decedent else "",
-            status=case_node["status"],
-            created_at=case_node["created_at"],
-            updated_at=case_node["updated_at"],
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # Case節点と被相続人情報を1回のクエリで取得
+    case_node, decedent = neo4j.get_case_with_decedent(case_id)
+    if not case_node:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
+
+    return _build_case_response(case_node, decedent)
 
 
 @router.patch(
@@ -178,7 +193,7 @@ async def get_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4
     summary="相続案件更新",
     description="指定されたIDの相続案件を更新します。",
 )
-async def update_case(
+def update_case(
     case_id: str, case_data: CaseUpdate, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]
 ) -> CaseResponse:
     """相続案件更新
@@ -194,53 +209,24 @@ async def update_case(
     Raises:
         HTTPException: 案件が見つからない場合
     """
-    try:
-        # 存在確認
-        existing_case = neo4j.get_case_by_id(case_id)
-        if not existing_case:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
-
-        # 更新データ準備（Noneでない項目のみ）
-        updates = {k: v for k, v in case_data.model_dump().items() if v is not None}
-
-        if not updates:
-            # 更新項目がない場合は既存データを返す
-            persons = neo4j.get_persons_by_case(case_id)
-            decedent = next((p for p in persons if p.get("is_decedent")), None)
-            return CaseResponse(
-                id=existing_case["id"],
-                title=existing_case["title"],
-                description=existing_case.get("description"),
-                decedent_name=decedent["name"] if decedent else "",
-                death_date=decedent.get("death_date", "") if decedent else "",
-                status=existing_case["status"],
-                created_at=existing_case["created_at"],
-                updated_at=existing_case["updated_at"],
-            )
-
-        # 更新実行
-        updated_case = neo4j.update_case(case_id, updates)
-        if not updated_case:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="更新に失敗しました")
-
-        # 被相続人情報を取得
-        persons = neo4j.get_persons_by_case(case_id)
-        decedent = next((p for p in persons if p.get("is_decedent")), None)
-
-        return CaseResponse(
-            id=updated_case["id"],
-            title=updated_case["title"],
-            description=updated_case.get("description"),
-            decedent_name=decedent["name"] if decedent else "",
-            death_date=decedent.get("death_date", "") if decedent else "",
-            status=updated_case["status"],
-            created_at=updated_case["created_at"],
-            updated_at=updated_case["updated_at"],
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # 存在確認（被相続人情報も同じクエリで取得）
+    existing_case, decedent = neo4j.get_case_with_decedent(case_id)
+    if not existing_case:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
+
+    # 更新データ準備（Noneでない項目のみ）
+    updates = case_data.model_dump(exclude_none=True)
+
+    if not updates:
+        # 更新項目がない場合は既存データを返す
+        return _build_case_response(existing_case, decedent)
+
+    # 更新実行
+    updated_case = neo4j.update_case(case_id, updates)
+    if not updated_case:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="更新に失敗しました")
+
+    return _build_case_response(updated_case, decedent)
 
 
 @router.delete(
@@ -250,7 +236,7 @@ async def update_case(
     summary="相続案件削除",
     description="指定されたIDの相続案件を削除します。関連する人物や関係性も全て削除されます。",
 )
-async def delete_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> None:
+def delete_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> None:
     """相続案件削除
 
     Args:
@@ -260,18 +246,13 @@ async def delete_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_n
     Raises:
         HTTPException: 案件が見つからない場合
     """
-    try:
-        # 存在確認
-        existing_case = neo4j.get_case_by_id(case_id)
-        if not existing_case:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
+    # 存在確認
+    existing_case = neo4j.get_case_by_id(case_id)
+    if not existing_case:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
 
-        # 削除実行
-        neo4j.delete_case(case_id)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # 削除実行
+    neo4j.delete_case(case_id)
 
 
 # Person管理エンドポイント
@@ -283,7 +264,7 @@ async def delete_case(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_n
     summary="人物追加",
     description="指定された案件に人物を追加します。",
 )
-async def create_person(
+def create_person(
     case_id: str, person_data: PersonCreate, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]
 ) -> PersonResponse:
     """人物追加
@@ -299,47 +280,31 @@ async def create_person(
     Raises:
         HTTPException: エラー時
     """
-    try:
-        # 案件存在確認
-        case_node = neo4j.get_case_by_id(case_id)
-        if not case_node:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
-
-        # 人物ID生成
-        person_id = f"person-{uuid.uuid4().hex[:12]}"
-
-        # 追加属性準備
-        kwargs = {}
-        if person_data.death_date:
-            kwargs["death_date"] = person_data.death_date
-        if person_data.birth_date:
-            kwargs["birth_date"] = person_data.birth_date
-        if person_data.gender:
-            kwargs["gender"] = person_data.gender
-
-        # Person節点作成
-        person_node = neo4j.create_person_node(
-            person_id=person_id,
-            case_id=case_id,
-            name=person_data.name,
-            is_alive=person_data.is_alive,
-            is_decedent=person_data.is_decedent,
-            **kwargs,
-        )
-
-        return PersonResponse(
-            id=person_node["id"],
-            name=person_node["name"],
-            is_alive=person_node["is_alive"],
-            death_date=person_node.get("death_date"),
-            birth_date=person_node.get("birth_date"),
-            gender=person_node.get("gender"),
-            is_decedent=person_node["is_decedent"],
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # 人物ID生成
+    person_id = f"person-{token_hex(6)}"
+
+    # 追加属性準備
+    kwargs = {}
+    if person_data.death_date:
+        kwargs["death_date"] = person_data.death_date
+    if person_data.birth_date:
+        kwargs["birth_date"] = person_data.birth_date
+    if person_data.gender:
+        kwargs["gender"] = person_data.gender
+
+    # Person節点作成（Caseが存在しない場合は何も作成されない）
+    person_node = neo4j.create_person_node(
+        person_id=person_id,
+        case_id=case_id,
+        name=person_data.name,
+        is_alive=person_data.is_alive,
+        is_decedent=person_data.is_decedent,
+        **kwargs,
+    )
+    if not person_node:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
+
+    return _build_person_response(person_node)
 
 
 @router.get(
@@ -347,14 +312,19 @@ async def create_person(
     response_model=list[PersonResponse],
     responses={404: {"model": ErrorResponse}},
     summary="人物一覧取得",
-    description="指定された案件の全ての人物を取得します。",
+    description="指定された案件の全ての人物を取得します。is_decedentで被相続人かどうかを絞り込めます。",
 )
-async def list_persons(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> list[PersonResponse]:
+def list_persons(
+    case_id: str,
+    neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)],
+    is_decedent: Annotated[Optional[bool], Query(description="被相続人かどうかで絞り込む")] = None,
+) -> list[PersonResponse]:
     """人物一覧取得
 
     Args:
         case_id: 案件ID
         neo4j: Neo4jサービス（DI）
+        is_decedent: 被相続人かどうかの絞り込み条件（未指定の場合は全員）
 
     Returns:
         list[PersonResponse]: 人物一覧
@@ -362,31 +332,15 @@ async def list_persons(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_
     Raises:
         HTTPException: 案件が見つからない場合
     """
-    try:
-        # 案件存在確認
-        case_node = neo4j.get_case_by_id(case_id)
-        if not case_node:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
-
-        # 人物一覧取得
-        person_nodes = neo4j.get_persons_by_case(case_id)
-
-        return [
-            PersonResponse(
-                id=p["id"],
-                name=p["name"],
-                is_alive=p["is_alive"],
-                death_date=p.get("death_date"),
-                birth_date=p.get("birth_date"),
-                gender=p.get("gender"),
-                is_decedent=p["is_decedent"],
-            )
-            for p in person_nodes
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # 案件存在確認
+    case_node = neo4j.get_case_by_id(case_id)
+    if not case_node:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
+
+    # 人物一覧取得
+    person_nodes = neo4j.get_persons_by_case(case_id, is_decedent=is_decedent)
+
+    return PersonListAdapter.validate_python(person_nodes)
 
 
 # Relationship管理エンドポイント
@@ -397,7 +351,7 @@ async def list_persons(case_id: str, neo4j: Annotated[Neo4jService, Depends(get_
     summary="関係性追加",
     description="人物間の関係性を追加します。",
 )
-async def create_relationship(
+def create_relationship(
     case_id: str, rel_data: RelationshipCreate, neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]
 ) -> dict[str, str]:
     """関係性追加
@@ -413,25 +367,20 @@ async def create_relationship(
     Raises:
         HTTPException: エラー時
     """
-    try:
-        # 案件存在確認
-        case_node = neo4j.get_case_by_id(case_id)
-        if not case_node:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
-
-        # 関係性作成
-        success = neo4j.create_relationship(
-            from_person_id=rel_data.from_person_id,
-            to_person_id=rel_data.to_person_id,
-            rel_type=rel_data.relationship_type,
-            properties=rel_data.properties,
-        )
-
-        if not success:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="関係性の作成に失敗しました")
-
-        return {"message": "関係性を作成しました"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    # 案件存在確認
+    case_node = neo4j.get_case_by_id(case_id)
+    if not case_node:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"案件が見つかりません: {case_id}")
+
+    # 関係性作成
+    success = neo4j.create_relationship(
+        from_person_id=rel_data.from_person_id,
+        to_person_id=rel_data.to_person_id,
+        rel_type=rel_data.relationship_type,
+        properties=rel_data.properties,
+    )
+
+    if not success:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="関係性の作成に失敗しました")
+
+    return {"message": "関係性を作成しました"}
@@ -1,29 +1,107 @@
 """AI対話WebSocket API"""
 
-import json
-import sys
-from pathlib import Path
+import asyncio
+from collections import OrderedDict, deque
 from typing import Any
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from app.core.config import settings
-
-# 親プロジェクトのsrcディレクトリをPythonパスに追加
-project_root = Path(__file__).parent.parent.parent.parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
-
-try:
-    from agents.interview_agent import InterviewAgent  # type: ignore[import-not-found]
-    from agents.ollama_client import OllamaClient  # type: ignore[import-not-found]
-    from utils.config import OllamaSettings  # type: ignore[import-not-found]
-except ImportError:
-    # テスト環境での代替処理
-    InterviewAgent = None  # type: ignore[assignment, misc]
-    OllamaClient = None  # type: ignore[assignment, misc]
-    OllamaSettings = None  # type: ignore[assignment, misc]
+from pydantic import ValidationError
+from app.core.config import get_settings
+from app.schemas import ChatMessage
+
+# エージェント関連クラス（初回のChatSession生成時に遅延インポート）
+InterviewAgent: Any = None
+OllamaClient: Any = None
+OllamaSettings: Any = None
+
+
+def _load_agent_classes() -> None:
+    """エージェント関連クラスを初回利用時にインポート
+
+    チャットを扱わないワーカーの起動を軽くするため、
+    モジュール読み込み時ではなく最初のセッション生成時に読み込む。
+    """
+    global InterviewAgent, OllamaClient, OllamaSettings
+    if InterviewAgent is not None:
+        return
+
+    from inheritance_calculator_core.agents.interview_agent import InterviewAgent as _InterviewAgent
+    from inheritance_calculator_core.agents.ollama_client import OllamaClient as _OllamaClient
+    from inheritance_calculator_core.utils.config import OllamaSettings as _OllamaSettings
+
+    OllamaSettings = _OllamaSettings
+    OllamaClient = _OllamaClient
+    InterviewAgent = _InterviewAgent
+
+
+# 全セッションで共有するOllamaクライアント（初回のChatSession生成時に作成）
+_ollama_client: Any = None
+
+
+def _get_ollama_client() -> Any:
+    """共有Ollamaクライアントを取得
+
+    接続確認と内部のHTTPコネクションをセッションごとに作り直さないよう、
+    クライアントはプロセス内で1つだけ生成する。
+
+    Returns:
+        Any: OllamaClientインスタンス
+    """
+    global _ollama_client
+    if _ollama_client is None:
+        _load_agent_classes()
+
+        # Ollama設定
+        settings = get_settings()
+        ollama_settings = OllamaSettings(
+            host=settings.ollama_host,
+            model=settings.ollama_model,
+            timeout=settings.ollama_timeout,
+            temperature=settings.ollama_temperature,
+        )
+        _ollama_client = OllamaClient(ollama_settings)
+    return _ollama_client
+
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# プロンプトに含める会話履歴の最大件数
+_HISTORY_WINDOW = 10
+
+# LLM応答キャッシュの最大件数
+_RESPONSE_CACHE_SIZE = 256
+
+# プロンプトをキーにしたLRUの応答キャッシュ（全セッションで共有）
+# 参照・更新はイベントループ上でのみ行うためロックは不要
+_response_cache: OrderedDict[str, str] = OrderedDict()
+
+# チャットセッションのシステムプロンプト
+_SYSTEM_PROMPT = """あなたは相続に関する情報を聞き取る専門のアシスタントです。
+
+ユーザーから以下の情報を丁寧に聞き取ってください：
+- 被相続人（亡くなった方）の情報
+- 配偶者の有無と情報
+- 子の有無と情報
+- 父母・祖父母の有無と情報
+- 兄弟姉妹の有無と情報
+- 代襲相続の可能性
+- 相続放棄・相続欠格・相続廃除の有無
+
+日本の民法に基づいた相続に関する質問を行い、必要な情報を収集してください。
+ユーザーに対して親切で分かりやすい言葉で質問してください。"""
+
+# 会話履歴の話者ラベル
+_ROLE_LABELS = {"user": "ユーザー", "assistant": "アシスタント"}
+
+# 会話履歴付きプロンプトのテンプレート
+_PROMPT_TEMPLATE = """これまでの会話:
+{history_text}
+
+ユーザーの最新メッセージ: {user_message}
+
+上記を踏まえて、次に聞くべき質問を1つ提示してください。
+すでに十分な情報が集まっている場合は、情報を整理して確認してください。"""
+
 
 class ChatSession:
     """チャットセッション管理クラス"""
@@ -36,20 +114,12 @@ class ChatSession:
         """
         self.case_id = case_id
 
-        # Ollama設定
-        ollama_settings = OllamaSettings(
-            host=settings.ollama_host,
-            model=settings.ollama_model,
-            timeout=settings.ollama_timeout,
-            temperature=settings.ollama_temperature,
-        )
-
-        # OllamaクライアントとInterviewAgentを初期化
-        self.ollama_client = OllamaClient(ollama_settings)
+        # 共有OllamaクライアントでInterviewAgentを初期化
+        self.ollama_client = _get_ollama_client()
         self.agent = InterviewAgent(self.ollama_client)
 
-        # セッション状態
-        self.conversation_history: list[dict[str, str]] = []
+        # セッション状態（古い履歴は自動的に破棄される）
+        self.conversation_history: deque[dict[str, str]] = deque(maxlen=_HISTORY_WINDOW)
 
     async def process_message(self, user_message: str) -> dict[str, Any]:
         """ユーザーメッセージを処理
@@ -67,12 +137,23 @@ class ChatSession:
             # InterviewAgentで処理
             # Note: 既存のInterviewAgentは対話的なCLI用なので、
             # ここでは簡易的にOllamaClientを直接使用
-            response = self.ollama_client.generate(
-                prompt=self._build_prompt(user_message),
-                system_prompt=self._get_system_prompt(),
-            )
-
-            agent_message = response.strip()
+            # システムプロンプトは固定のため、会話履歴を含むプロンプトが一致すれば応答を再利用
+            prompt = self._build_prompt(user_message)
+            agent_message = _response_cache.get(prompt)
+            if agent_message is not None:
+                _response_cache.move_to_end(prompt)
+            else:
+                # 同期HTTP呼び出しのため、イベントループを塞がないようスレッドで実行
+                response = await asyncio.to_thread(
+                    self.ollama_client.generate,
+                    prompt=prompt,
+                    system_prompt=_SYSTEM_PROMPT,
+                )
+
+                agent_message = response.strip()
+                _response_cache[prompt] = agent_message
+                if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                    _response_cache.popitem(last=False)
 
             # 会話履歴に追加
             self.conversation_history.append({"role": "assistant", "content": agent_message})
@@ -87,26 +168,6 @@ class ChatSession:
         except Exception as e:
             return {"type": "error", "content": f"エラーが発生しました: {str(e)}", "case_id": self.case_id}
 
-    def _get_system_prompt(self) -> str:
-        """システムプロンプトを取得
-
-        Returns:
-            str: システムプロンプト
-        """
-        return """あなたは相続に関する情報を聞き取る専門のアシスタントです。
-
-ユーザーから以下の情報を丁寧に聞き取ってください：
-- 被相続人（亡くなった方）の情報
-- 配偶者の有無と情報
-- 子の有無と情報
-- 父母・祖父母の有無と情報
-- 兄弟姉妹の有無と情報
-- 代襲相続の可能性
-- 相続放棄・相続欠格・相続廃除の有無
-
-日本の民法に基づいた相続に関する質問を行い、必要な情報を収集してください。
-ユーザーに対して親切で分かりやすい言葉で質問してください。"""
-
     def _build_prompt(self, user_message: str) -> str:
         """プロンプトを構築
 
@@ -117,18 +178,37 @@ class ChatSession:
             str: 構築されたプロンプト
         """
         # 会話履歴を含めたプロンプト
-        history_text = ""
-        for msg in self.conversation_history[-10:]:  # 最新10件のみ
-            role = "ユーザー" if msg["role"] == "user" else "アシスタント"
-            history_text += f"{role}: {msg['content']}\n\n"
+        history_text = "".join(
+            f"{_ROLE_LABELS.get(msg['role'], 'アシスタント')}: {msg['content']}\n\n"
+            for msg in self.conversation_history
+        )
 
-        return f"""これまでの会話:
-{history_text}
+        return _PROMPT_TEMPLATE.format(history_text=history_text, user_message=user_message)
 
-ユーザーの最新メッセージ: {user_message}
 
-上記を踏まえて、次に聞くべき質問を1つ提示してください。
-すでに十分な情報が集まっている場合は、情報を整理して確認してください。"""
+def _extract_user_message(data: str) -> str:
+    """受信データからユーザーメッセージを取り出す
+
+    Args:
+        data: WebSocketで受信した文字列
+
+    Returns:
+        str: {"message": ...}形式のJSONであればその値、それ以外は受信文字列そのもの
+    """
+    try:
+        return ChatMessage.model_validate_json(data).message
+    except ValidationError:
+        return data
+
+
+async def _send_json(websocket: WebSocket, payload: dict[str, Any]) -> None:
+    """orjsonでシリアライズしたJSONをテキストフレームで送信
+
+    Args:
+        websocket: WebSocket接続
+        payload: 送信するデータ
+    """
+    await websocket.send_text(orjson.dumps(payload).decode())
 
 
 # WebSocketエンドポイント
@@ -146,12 +226,13 @@ async def chat_websocket(websocket: WebSocket, case_id: str) -> None:
     session = ChatSession(case_id)
 
     # 初期メッセージ送信
-    await websocket.send_json(
+    await _send_json(
+        websocket,
         {
             "type": "connected",
             "message": "AI対話セッションを開始しました。相続に関する情報をお聞かせください。",
             "case_id": case_id,
-        }
+        },
     )
 
     try:
@@ -160,17 +241,13 @@ async def chat_websocket(websocket: WebSocket, case_id: str) -> None:
             data = await websocket.receive_text()
 
             # JSON形式でない場合はそのままテキストとして扱う
-            try:
-                message_data = json.loads(data)
-                user_message = message_data.get("message", data)
-            except json.JSONDecodeError:
-                user_message = data
+            user_message = _extract_user_message(data)
 
             # メッセージ処理
             response = await session.process_message(user_message)
 
             # レスポンス送信
-            await websocket.send_json(response)
+            await _send_json(websocket, response)
 
     except WebSocketDisconnect:
         # 切断時の処理
@@ -178,7 +255,7 @@ async def chat_websocket(websocket: WebSocket, case_id: str) -> None:
     except Exception as e:
         # エラー時の処理
         try:
-            await websocket.send_json({"type": "error", "content": f"サーバーエラー: {str(e)}"})
+            await _send_json(websocket, {"type": "error", "content": f"サーバーエラー: {str(e)}"})
         except Exception:
             pass
         finally:
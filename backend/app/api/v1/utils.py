@@ -1,5 +1,6 @@
 """ユーティリティAPI - 元号変換エンドポイント"""
 
+import re
 from fastapi import APIRouter, HTTPException, status
 from app.schemas import DateConversionRequest, DateConversionResponse, ErrorResponse
 from app.services.era_converter import (
@@ -12,6 +13,11 @@ from datetime import date
 
 router = APIRouter(prefix="/utils", tags=["utils"])
 
+# 西暦形式（YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD）の判定パターン
+_WESTERN_RE = re.compile(r"^(\d{4})[\-/.](\d{1,2})[\-/.](\d{1,2})$")
+# 区切り文字をISO形式のハイフンに統一する変換テーブル
+_SEPARATOR_TABLE = str.maketrans("/.", "--")
+
 
 @router.post(
     "/convert-era-to-western",
@@ -109,14 +115,11 @@ async def detect_and_convert(request: DateConversionRequest) -> DateConversionRe
     Raises:
         HTTPException: 変換エラー時
     """
-    import re
-
     try:
         # 西暦形式かチェック（YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD）
-        western_pattern = r"^(\d{4})[\-/.](\d{1,2})[\-/.](\d{1,2})$"
-        if re.match(western_pattern, request.date_str):
+        if _WESTERN_RE.match(request.date_str):
             # 西暦形式 → 元号に変換
-            parsed_date = date.fromisoformat(request.date_str.replace("/", "-").replace(".", "-"))
+            parsed_date = date.fromisoformat(request.date_str.translate(_SEPARATOR_TABLE))
             era_str = format_japanese_date(parsed_date, request.format_type)
             era_name = get_era_name(parsed_date)
             return DateConversionResponse(
@@ -1,8 +1,10 @@
 """アプリケーション設定"""
 
-from typing import List
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import json
+from functools import lru_cache
+from typing import Annotated, Any
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -24,10 +26,10 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="ホスト")
     port: int = Field(default=8000, description="ポート")
 
-    # CORS設定
-    allowed_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:3001"],
-        description="許可するオリジン",
+    # CORS設定（リクエストごとの照合をO(1)にするためfrozensetで保持）
+    allowed_origins: Annotated[frozenset[str], NoDecode] = Field(
+        default=frozenset({"http://localhost:3000", "http://localhost:3001"}),
+        description="許可するオリジン（カンマ区切りまたはJSON配列）",
     )
 
     # Neo4j設定
@@ -51,5 +53,36 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="ログレベル")
     log_file: str = Field(default="logs/backend.log", description="ログファイル")
 
+    @field_validator("allowed_origins", mode="before")
+    @classmethod
+    def parse_allowed_origins(cls, v: Any) -> Any:
+        """許可オリジンを正規化
 
-settings = Settings()
+        カンマ区切り文字列とJSON配列の両方を受け付け、
+        ブラウザのOriginヘッダと一致するよう末尾のスラッシュを除去する。
+
+        Args:
+            v: 設定値
+
+        Returns:
+            Any: 正規化されたオリジンの集合
+        """
+        if isinstance(v, str):
+            v = json.loads(v) if v.lstrip().startswith("[") else v.split(",")
+        return frozenset(origin.strip().rstrip("/") for origin in v if origin.strip())
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Settingsのシングルトンインスタンス取得
+
+    環境変数と.envファイルの読み込みは初回呼び出し時のみ行う。
+    テストで設定を差し替える場合は get_settings.cache_clear() を呼ぶ。
+
+    Returns:
+        Settings: アプリケーション設定
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,7 +1,10 @@
 """FastAPI メインアプリケーション"""
 
-from fastapi import FastAPI
+import logging
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from neo4j.exceptions import Neo4jError
 from app.core.config import settings
 from app.api.v1 import api_router
 
@@ -25,6 +28,38 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
+logger = logging.getLogger(__name__)
+
+
+# 例外ハンドラは特定の例外クラスにのみ登録する（Exceptionに登録するとCORSMiddlewareの外側で実行され、
+# ブラウザからエラー応答を参照できなくなる）。それ以外の未処理例外はサーバーの既定の500応答になる。
+def _server_error_response(request: Request, exc: Exception, detail: str) -> JSONResponse:
+    """例外をログに記録し、内部情報を含まない500エラーのJSONレスポンスを返す
+
+    Args:
+        request: リクエスト
+        exc: 発生した例外
+        detail: クライアントに返すメッセージ
+
+    Returns:
+        JSONResponse: 500エラーレスポンス
+    """
+    logger.error("%s %s の処理中にエラーが発生しました", request.method, request.url.path, exc_info=exc)
+    return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"detail": detail})
+
+
+@app.exception_handler(Neo4jError)
+async def neo4j_error_handler(request: Request, exc: Neo4jError) -> JSONResponse:
+    """Neo4jのエラーを500エラーのJSONレスポンスに変換"""
+    return _server_error_response(request, exc, "データベースエラーが発生しました")
+
+
+@app.exception_handler(TimeoutError)
+async def timeout_error_handler(request: Request, exc: TimeoutError) -> JSONResponse:
+    """タイムアウトを500エラーのJSONレスポンスに変換"""
+    return _server_error_response(request, exc, "処理がタイムアウトしました")
+
+
 @app.get("/", tags=["root"])
 async def root() -> dict[str, str]:
     """ルートエンドポイント"""
@@ -17,15 +17,18 @@ from app.schemas.person_schema import (
     PersonCreate,
     PersonUpdate,
     PersonResponse,
+    PersonListAdapter,
     RelationshipCreate,
     RelationshipResponse,
     FamilyTreeResponse,
 )
 from app.schemas.calculation_schema import (
     HeirInfo,
+    HeirListAdapter,
     CalculationResult,
     CalculationRequest,
 )
+from app.schemas.chat_schema import ChatMessage
 
 __all__ = [
     "DateConversionRequest",
@@ -40,10 +43,13 @@ __all__ = [
     "PersonCreate",
     "PersonUpdate",
     "PersonResponse",
+    "PersonListAdapter",
     "RelationshipCreate",
     "RelationshipResponse",
     "FamilyTreeResponse",
     "HeirInfo",
+    "HeirListAdapter",
     "CalculationResult",
     "CalculationRequest",
+    "ChatMessage",
 ]
@@ -1,7 +1,13 @@
 """相続計算結果のPydanticスキーマ"""
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+
+# 続柄（日本語表記）
+HeirRelationship = Literal["配偶者", "子", "直系尊属", "祖父母", "兄弟姉妹"]
+
+# 相続順位（0=配偶者, 1-3=第1-3順位）
+HeirRank = Literal[0, 1, 2, 3]
 
 
 class HeirInfo(BaseModel):
@@ -9,15 +15,18 @@ class HeirInfo(BaseModel):
 
     person_id: str = Field(..., description="人物ID")
     name: str = Field(..., description="氏名")
-    relationship: str = Field(..., description="続柄")
-    rank: int = Field(..., description="相続順位（0=配偶者, 1-3=第1-3順位）")
+    relationship: HeirRelationship = Field(..., description="続柄")
+    rank: HeirRank = Field(..., description="相続順位（0=配偶者, 1-3=第1-3順位）")
     share_numerator: int = Field(..., description="相続割合の分子")
     share_denominator: int = Field(..., description="相続割合の分母")
     share_percentage: float = Field(..., description="相続割合（パーセント）")
     is_substitute: bool = Field(default=False, description="代襲相続フラグ")
     substitute_for: Optional[str] = Field(default=None, description="代襲される人物ID")
 
+    # 計算結果は生成後に変更しないため不変にする
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -36,6 +45,10 @@ class HeirInfo(BaseModel):
     }
 
 
+# 相続人の行データを一括検証するアダプタ（インポート時に一度だけ構築）
+HeirListAdapter = TypeAdapter(list[HeirInfo])
+
+
 class CalculationResult(BaseModel):
     """相続計算結果"""
 
@@ -46,6 +59,8 @@ class CalculationResult(BaseModel):
     calculation_basis: str = Field(..., description="計算根拠（民法条文など）")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -60,4 +60,5 @@ class CaseListResponse(BaseModel):
     cases: list[CaseResponse] = Field(..., description="案件リスト")
     total: int = Field(..., description="総件数")
 
-    model_config = {"json_schema_extra": {"examples": [{"cases": [], "total": 0}]}}
+    # 検証済みの子モデルを再検証しない（大量件数時のコピーを避ける）
+    model_config = {"revalidate_instances": "never", "json_schema_extra": {"examples": [{"cases": [], "total": 0}]}}
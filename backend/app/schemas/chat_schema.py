@@ -0,0 +1,11 @@
+"""AI対話用Pydanticスキーマ"""
+
+from pydantic import BaseModel, Field
+
+
+class ChatMessage(BaseModel):
+    """WebSocketで受信するチャットメッセージ"""
+
+    message: str = Field(..., description="ユーザーのメッセージ")
+
+    model_config = {"json_schema_extra": {"examples": [{"message": "父が亡くなりました"}]}}
@@ -1,7 +1,32 @@
 """人物（Person）のPydanticスキーマ"""
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Literal, Optional, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, with_config
+
+# 関係性タイプ（Neo4jのリレーションシップ型）
+RelationshipType = Literal["CHILD_OF", "SPOUSE_OF", "SIBLING_OF", "RENOUNCED", "DISQUALIFIED", "DISINHERITED"]
+
+
+# 未定義の属性は黙って捨てずに422として拒否する
+@with_config(ConfigDict(extra="forbid"))
+class RelationshipProperties(TypedDict, total=False):
+    """関係性の追加属性（関係性タイプごとに使用する項目のみ設定）"""
+
+    # CHILD_OF
+    is_biological: bool
+    adoption: bool
+    # SPOUSE_OF
+    marriage_date: str
+    divorce_date: str
+    is_current: bool
+    # SIBLING_OF
+    blood_type: str
+    shared_parent: str
+    # RENOUNCED / DISQUALIFIED / DISINHERITED
+    reason: str
+    renounce_date: str
+    date: str
+    court_decision_date: str
 
 
 class PersonBase(BaseModel):
@@ -54,17 +79,21 @@ class PersonResponse(PersonBase):
     }
 
 
+# Neo4jから取得した人物節点リストを一括検証するアダプタ（インポート時に一度だけ構築）
+PersonListAdapter = TypeAdapter(list[PersonResponse])
+
+
 class RelationshipCreate(BaseModel):
     """関係性作成リクエスト"""
 
     case_id: str = Field(..., description="所属する案件ID")
     from_person_id: str = Field(..., description="関係の起点となる人物ID")
     to_person_id: str = Field(..., description="関係の終点となる人物ID")
-    relationship_type: str = Field(
+    relationship_type: RelationshipType = Field(
         ...,
         description="関係性タイプ (CHILD_OF, SPOUSE_OF, SIBLING_OF, RENOUNCED, DISQUALIFIED, DISINHERITED)",
     )
-    properties: Optional[dict[str, str | bool | int]] = Field(default=None, description="関係性の追加属性")
+    properties: Optional[RelationshipProperties] = Field(default=None, description="関係性の追加属性")
 
 
 class RelationshipResponse(BaseModel):
@@ -72,8 +101,8 @@ class RelationshipResponse(BaseModel):
 
     from_person_id: str = Field(..., description="起点人物ID")
     to_person_id: str = Field(..., description="終点人物ID")
-    relationship_type: str = Field(..., description="関係性タイプ")
-    properties: dict[str, str | bool | int] = Field(default_factory=dict, description="関係性の追加属性")
+    relationship_type: RelationshipType = Field(..., description="関係性タイプ")
+    properties: RelationshipProperties = Field(default_factory=RelationshipProperties, description="関係性の追加属性")
 
     model_config = {
         "json_schema_extra": {
@@ -95,4 +124,8 @@ class FamilyTreeResponse(BaseModel):
     persons: list[PersonResponse] = Field(..., description="人物リスト")
     relationships: list[RelationshipResponse] = Field(..., description="関係性リスト")
 
-    model_config = {"json_schema_extra": {"examples": [{"persons": [], "relationships": []}]}}
+    # 検証済みの子モデルを再検証しない（大量件数時のコピーを避ける）
+    model_config = {
+        "revalidate_instances": "never",
+        "json_schema_extra": {"examples": [{"persons": [], "relationships": []}]},
+    }
@@ -1,29 +1,97 @@
 """相続計算サービス - 既存のInheritanceCalculatorをバックエンドAPIから利用"""
 
-import sys
-from pathlib import Path
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Annotated, Any, Optional
 from fractions import Fraction
 
-# 親プロジェクトのsrcディレクトリをPythonパスに追加
-project_root = Path(__file__).parent.parent.parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
-
-try:
-    from services.inheritance_calculator import InheritanceCalculator  # type: ignore[import-not-found]
-    from services.share_calculator import ShareCalculator  # type: ignore[import-not-found]
-    from database.repositories import PersonRepository  # type: ignore[import-not-found]
-    from utils.config import Neo4jSettings  # type: ignore[import-not-found]
-except ImportError:
-    # テスト環境での代替処理
-    InheritanceCalculator = None  # type: ignore[assignment, misc]
-    ShareCalculator = None  # type: ignore[assignment, misc]
-    PersonRepository = None  # type: ignore[assignment, misc]
-    Neo4jSettings = None  # type: ignore[assignment, misc]
+from fastapi import Depends
 from app.core.config import settings
-from app.schemas.calculation_schema import HeirInfo, CalculationResult
-from app.services.neo4j_service import Neo4jService
+from app.schemas.calculation_schema import HeirInfo, HeirListAdapter, CalculationResult
+from app.services.neo4j_service import Neo4jService, get_neo4j_service
+
+# 相続計算関連クラス（初回のCalculationService生成時に遅延インポート）
+InheritanceCalculator: Any = None
+ShareCalculator: Any = None
+Neo4jSettings: Any = None
+
+
+def _load_calculator_classes() -> None:
+    """相続計算関連クラスを初回利用時にインポート
+
+    相続計算・グラフ探索モジュールの読み込みは重いため、
+    モジュール読み込み時ではなく最初のサービス生成時に読み込む。
+    """
+    global InheritanceCalculator, ShareCalculator, Neo4jSettings
+    if InheritanceCalculator is not None:
+        return
+
+    from inheritance_calculator_core.services.inheritance_calculator import (
+        InheritanceCalculator as _InheritanceCalculator,
+    )
+    from inheritance_calculator_core.services.share_calculator import ShareCalculator as _ShareCalculator
+    from inheritance_calculator_core.utils.config import Neo4jSettings as _Neo4jSettings
+
+    Neo4jSettings = _Neo4jSettings
+    ShareCalculator = _ShareCalculator
+    InheritanceCalculator = _InheritanceCalculator
+
+
+# 計算結果キャッシュの最大件数
+_RESULT_CACHE_SIZE = 256
+
+# 相続割合が割り当てられていない相続人の相続割合（Fractionは不変のため共有する）
+_NO_SHARE = Fraction(0, 1)
+
+# 続柄（英語）→ (日本語表記, 相続順位)
+_HEIR_TAGS: Mapping[str, tuple[str, int]] = MappingProxyType(
+    {
+        "spouse": ("配偶者", 0),
+        "child": ("子", 1),
+        "parent": ("直系尊属", 2),
+        "grandparent": ("祖父母", 2),
+        "sibling": ("兄弟姉妹", 3),
+    }
+)
+
+# 計算根拠判定用のフラグ
+_FLAG_SPOUSE = 1
+_FLAG_CHILD = 2
+_FLAG_PARENT = 4
+_FLAG_SIBLING = 8
+_FLAG_SUB_CHILD = 16
+_FLAG_SUB_SIBLING = 32
+
+# 相続順位 → フラグ（代襲相続なし, 代襲相続あり）
+_RANK_FLAGS: Mapping[int, tuple[int, int]] = MappingProxyType(
+    {
+        0: (_FLAG_SPOUSE, _FLAG_SPOUSE),
+        1: (_FLAG_CHILD, _FLAG_CHILD | _FLAG_SUB_CHILD),
+        2: (_FLAG_PARENT, _FLAG_PARENT),
+        3: (_FLAG_SIBLING, _FLAG_SIBLING | _FLAG_SUB_SIBLING),
+    }
+)
+
+# 計算根拠の条文（該当フラグ, 条文）を出力順に並べたもの。フラグが0の条文は常に含める
+_BASIS_ARTICLES: tuple[tuple[int, str], ...] = (
+    (_FLAG_SPOUSE, "民法890条（配偶者の相続権）"),
+    (_FLAG_CHILD, "民法887条1項（子の相続権）"),
+    (_FLAG_SUB_CHILD, "民法887条2項（代襲相続）"),
+    (_FLAG_PARENT, "民法889条1項1号（直系尊属の相続権）"),
+    (_FLAG_SIBLING, "民法889条1項2号（兄弟姉妹の相続権）"),
+    (_FLAG_SUB_SIBLING, "民法889条2項（兄弟姉妹の代襲相続）"),
+    (0, "民法900条（法定相続分）"),
+    (_FLAG_SUB_CHILD, "民法901条（代襲相続人の相続分）"),
+)
+
+
+class UnsupportedRelationshipError(RuntimeError):
+    """相続人判定結果に変換表にない続柄が含まれる場合のエラー
+
+    案件未検出（ValueError）とは区別し、APIではサーバー側のエラーとして扱う。
+    """
 
 
 class CalculationService:
@@ -37,6 +105,8 @@ class CalculationService:
         """
         self.neo4j_service = neo4j_service
 
+        _load_calculator_classes()
+
         # 既存のNeo4j設定でInheritanceCalculatorを初期化
         neo4j_settings = Neo4jSettings(
             uri=settings.neo4j_uri,
@@ -47,6 +117,10 @@ class CalculationService:
         self.calculator = InheritanceCalculator(neo4j_settings)
         self.share_calculator = ShareCalculator()
 
+        # (案件ID, 更新日時) をキーにしたLRUの計算結果キャッシュ（値は不変なJSON文字列）
+        self._result_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
     def calculate_inheritance(self, case_id: str) -> CalculationResult:
         """相続計算実行
 
@@ -58,19 +132,50 @@ class CalculationService:
 
         Raises:
             ValueError: 案件が見つからない場合
+            UnsupportedRelationshipError: 相続人の続柄が未対応の場合
         """
-        # Case存在確認
-        case_node = self.neo4j_service.get_case_by_id(case_id)
+        # Case節点と配下の人物を1回のクエリで取得
+        case_node, persons = self.neo4j_service.get_case_with_persons(case_id)
         if not case_node:
             raise ValueError(f"案件が見つかりません: {case_id}")
 
-        # 被相続人を取得
-        persons = self.neo4j_service.get_persons_by_case(case_id)
+        # 人物・関係性の追加や案件更新で更新日時が変わるため、キャッシュは自然に無効化される
+        cache_key = (case_id, str(case_node["updated_at"]))
+        with self._result_cache_lock:
+            result_json = self._result_cache.get(cache_key)
+            if result_json is not None:
+                self._result_cache.move_to_end(cache_key)
+
+        if result_json is None:
+            result_json = self._calculate(case_id, persons).model_dump_json()
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = result_json
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        return CalculationResult.model_validate_json(result_json)
+
+    def _calculate(self, case_id: str, persons: list[dict[str, Any]]) -> CalculationResult:
+        """相続計算本体
+
+        Args:
+            case_id: 案件ID
+            persons: 案件配下のPerson節点リスト
+
+        Returns:
+            CalculationResult: 計算結果
+
+        Raises:
+            ValueError: 被相続人が見つからない場合
+            UnsupportedRelationshipError: 相続人の続柄が未対応の場合
+        """
+        # 被相続人の特定
         decedent = next((p for p in persons if p.get("is_decedent")), None)
         if not decedent:
             raise ValueError("被相続人が見つかりません")
 
         decedent_name = decedent["name"]
+        name_to_id = {p["name"]: p["id"] for p in persons}
 
         # 相続人を判定（既存のInheritanceCalculatorを使用）
         # Note: 既存のcalculatorはPersonRepositoryを使ってデータを取得するため、
@@ -81,38 +186,37 @@ class CalculationService:
         heirs_list = inheritance_result.heirs
         shares = self.share_calculator.calculate_shares(heirs_list)
 
-        # 結果をAPIスキーマに変換
-        heir_infos: list[HeirInfo] = []
+        # 結果をAPIスキーマ用の行データに変換（検証は最後にまとめて行う）
+        heir_rows: list[dict[str, Any]] = []
         for heir_model in heirs_list:
             # 相続割合を取得
-            share_fraction = shares.get(heir_model.name, Fraction(0, 1))
-
-            # 続柄の日本語表記
-            relationship_map = {
-                "spouse": "配偶者",
-                "child": "子",
-                "parent": "直系尊属",
-                "grandparent": "祖父母",
-                "sibling": "兄弟姉妹",
-            }
-            relationship_jp = relationship_map.get(heir_model.relationship, heir_model.relationship)
-
-            # 相続順位
-            rank_map = {"spouse": 0, "child": 1, "parent": 2, "grandparent": 2, "sibling": 3}
-            rank = rank_map.get(heir_model.relationship, 0)
-
-            heir_info = HeirInfo(
-                person_id=f"person-{heir_model.name}",  # 仮のID（実際はNeo4jから取得すべき）
-                name=heir_model.name,
-                relationship=relationship_jp,
-                rank=rank,
-                share_numerator=share_fraction.numerator,
-                share_denominator=share_fraction.denominator,
-                share_percentage=float(share_fraction) * 100,
-                is_substitute=heir_model.is_substitute_heir,
-                substitute_for=heir_model.original_heir if heir_model.is_substitute_heir else None,
+            share_fraction = shares.get(heir_model.name, _NO_SHARE)
+            numerator, denominator = share_fraction.numerator, share_fraction.denominator
+
+            # 続柄の日本語表記と相続順位（未対応の続柄を配偶者などとして扱わないよう明示的に失敗させる）
+            heir_tag = _HEIR_TAGS.get(heir_model.relationship)
+            if heir_tag is None:
+                raise UnsupportedRelationshipError(
+                    f"未対応の続柄です: {heir_model.relationship}（{heir_model.name}）"
+                )
+            relationship_jp, rank = heir_tag
+
+            heir_rows.append(
+                {
+                    "person_id": name_to_id.get(heir_model.name, heir_model.name),
+                    "name": heir_model.name,
+                    "relationship": relationship_jp,
+                    "rank": rank,
+                    "share_numerator": numerator,
+                    "share_denominator": denominator,
+                    # 分子を先に100倍して整数のまま割ることで、float変換後の乗算による丸め誤差を避ける
+                    "share_percentage": numerator * 100 / denominator,
+                    "is_substitute": heir_model.is_substitute_heir,
+                    "substitute_for": heir_model.original_heir if heir_model.is_substitute_heir else None,
+                }
             )
-            heir_infos.append(heir_info)
+
+        heir_infos = HeirListAdapter.validate_python(heir_rows)
 
         # 計算根拠の生成
         calculation_basis = self._generate_calculation_basis(heir_infos)
@@ -134,40 +238,31 @@ class CalculationService:
         Returns:
             str: 計算根拠の説明
         """
-        bases = []
-
-        # 配偶者がいるかチェック
-        has_spouse = any(h.relationship == "配偶者" for h in heirs)
-        if has_spouse:
-            bases.append("民法890条（配偶者の相続権）")
-
-        # 第1順位（子）がいるかチェック
-        has_children = any(h.rank == 1 for h in heirs)
-        if has_children:
-            bases.append("民法887条1項（子の相続権）")
-            # 代襲相続があるかチェック
-            has_substitute = any(h.is_substitute and h.rank == 1 for h in heirs)
-            if has_substitute:
-                bases.append("民法887条2項（代襲相続）")
-
-        # 第2順位（直系尊属）がいるかチェック
-        has_parents = any(h.rank == 2 for h in heirs)
-        if has_parents:
-            bases.append("民法889条1項1号（直系尊属の相続権）")
-
-        # 第3順位（兄弟姉妹）がいるかチェック
-        has_siblings = any(h.rank == 3 for h in heirs)
-        if has_siblings:
-            bases.append("民法889条1項2号（兄弟姉妹の相続権）")
-            # 代襲相続があるかチェック
-            has_substitute_sibling = any(h.is_substitute and h.rank == 3 for h in heirs)
-            if has_substitute_sibling:
-                bases.append("民法889条2項（兄弟姉妹の代襲相続）")
-
-        # 相続割合の根拠
-        bases.append("民法900条（法定相続分）")
-
-        if has_substitute:
-            bases.append("民法901条（代襲相続人の相続分）")
-
-        return "、".join(bases)
+        # 相続人を1回だけ走査し、該当する区分をフラグにまとめる
+        flags = 0
+        for h in heirs:
+            flags |= _RANK_FLAGS.get(h.rank, (0, 0))[h.is_substitute]
+
+        return "、".join(article for flag, article in _BASIS_ARTICLES if not flag or flags & flag)
+
+
+# グローバルインスタンス（依存性注入用）
+_calculation_service: Optional[CalculationService] = None
+
+
+def get_calculation_service(neo4j: Annotated[Neo4jService, Depends(get_neo4j_service)]) -> CalculationService:
+    """CalculationServiceのシングルトンインスタンス取得
+
+    InheritanceCalculatorの初期化コストを全リクエストで共有するため、
+    Neo4jServiceが同一である限り同じインスタンスを返す。
+
+    Args:
+        neo4j: Neo4jサービス（DI）
+
+    Returns:
+        CalculationService: CalculationServiceインスタンス
+    """
+    global _calculation_service
+    if _calculation_service is None or _calculation_service.neo4j_service is not neo4j:
+        _calculation_service = CalculationService(neo4j)
+    return _calculation_service
@@ -3,18 +3,14 @@
 既存のera_converterモジュールをバックエンドAPIから利用可能にするラッパー
 """
 
-import sys
-from pathlib import Path
+from functools import lru_cache
 from datetime import date
+from typing import Optional
 
-# 親プロジェクトのsrcディレクトリをPythonパスに追加
-project_root = Path(__file__).parent.parent.parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
-
-from utils.era_converter import (  # type: ignore[import-not-found]
-    parse_japanese_date,
-    format_japanese_date,
+from inheritance_calculator_core.utils.era_converter import (
+    ERA_MAP,
+    parse_japanese_date as _parse_japanese_date,
+    format_japanese_date as _format_japanese_date,
     get_era_name,
     EraConversionError,
 )
@@ -26,6 +22,106 @@ __all__ = [
     "EraConversionError",
 ]
 
+# 変換結果キャッシュの最大件数
+_CACHE_SIZE = 4096
+
+# 元号名 → (開始年, 開始日, 終了日)（高速パスでの範囲チェック用）
+_ERA_BOUNDS: dict[str, tuple[int, date, date]] = {
+    era_name: (
+        start_year,
+        date(start_year, start_month, start_day),
+        date(end_year, end_month, end_day) if end_year and end_month and end_day else date.max,
+    )
+    for era_name, (_, start_year, start_month, start_day, end_year, end_month, end_day) in ERA_MAP.items()
+}
+
+
+def _is_ascii_number(text: str) -> bool:
+    """1-2桁の半角数字かどうか"""
+    return 0 < len(text) <= 2 and text.isascii() and text.isdigit()
+
+
+def _parse_common_formats(input_str: str) -> Optional[date]:
+    """よく使われる日付形式を正規表現を使わずに解析
+
+    西暦ISO形式（"2023-10-03"）と元号の漢字形式（"令和5年10月3日"）のみを扱う。
+    それ以外の形式や不正な日付はNoneを返し、汎用の解析処理に委ねる。
+
+    Args:
+        input_str: 日付文字列
+
+    Returns:
+        Optional[date]: 解析できた場合は日付、それ以外はNone
+    """
+    # 西暦ISO形式: YYYY-MM-DD
+    if len(input_str) == 10 and input_str[4] == "-" and input_str[7] == "-" and input_str.isascii():
+        try:
+            return date.fromisoformat(input_str)
+        except ValueError:
+            return None
+
+    # 元号の漢字形式: 令和5年10月3日
+    bounds = _ERA_BOUNDS.get(input_str[:2])
+    if bounds is None or not input_str.endswith("日"):
+        return None
+    era_year, sep_year, rest = input_str[2:-1].partition("年")
+    month, sep_month, day = rest.partition("月")
+    if not (sep_year and sep_month and _is_ascii_number(era_year) and _is_ascii_number(month)):
+        return None
+    if not _is_ascii_number(day) or era_year == "0":
+        return None
+
+    start_year, era_start, era_end = bounds
+    try:
+        result = date(start_year + int(era_year) - 1, int(month), int(day))
+    except ValueError:
+        return None
+    return result if era_start <= result <= era_end else None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_japanese_date(input_str: str) -> date:
+    """元号または西暦の日付文字列を解析（結果をキャッシュ）
+
+    同じ日付文字列は繰り返し入力されることが多いため、解析結果を再利用する。
+    変換できない場合の例外はキャッシュされない。
+
+    Args:
+        input_str: 日付文字列（例: "令和5年10月3日", "R5.10.3", "2023-10-03"）
+
+    Returns:
+        date: 解析された日付
+
+    Raises:
+        EraConversionError: 変換できない形式の場合
+    """
+    fast_result = _parse_common_formats(input_str)
+    if fast_result is not None:
+        return fast_result
+
+    result: date = _parse_japanese_date(input_str)
+    return result
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def format_japanese_date(target_date: date, format_type: str = "long") -> str:
+    """日付を元号形式の文字列に変換（結果をキャッシュ）
+
+    案件一覧などでは同じ日付が繰り返し表示されるため、変換結果を再利用する。
+
+    Args:
+        target_date: 変換する日付
+        format_type: 出力形式 ("long", "short", "slash")
+
+    Returns:
+        str: 元号形式の日付文字列
+
+    Raises:
+        EraConversionError: 変換できない日付・形式の場合
+    """
+    result: str = _format_japanese_date(target_date, format_type)
+    return result
+
 
 def convert_era_to_western(era_str: str) -> str:
     """元号形式の日付文字列を西暦形式(YYYY-MM-DD)に変換
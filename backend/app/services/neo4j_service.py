@@ -1,22 +1,34 @@
 """Neo4jサービス - 既存のNeo4jClientをバックエンドAPIから利用"""
 
-import sys
-from pathlib import Path
-from typing import Any, Optional
-
-# 親プロジェクトのsrcディレクトリをPythonパスに追加
-project_root = Path(__file__).parent.parent.parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
-
-try:
-    from database.neo4j_client import Neo4jClient  # type: ignore[import-not-found]
-    from utils.config import Neo4jSettings  # type: ignore[import-not-found]
-except ImportError:
-    # テスト環境での代替処理
-    Neo4jClient = None  # type: ignore[assignment, misc]
-    Neo4jSettings = None  # type: ignore[assignment, misc]
+from collections.abc import Mapping
+from typing import Any, Optional, get_args
+
 from app.core.config import settings
+from app.schemas.person_schema import RelationshipType
+
+# 作成可能な関係性タイプ（Cypherではリレーションシップ型をパラメータ化できないため事前に検証する）
+_RELATIONSHIP_TYPES = frozenset(get_args(RelationshipType))
+
+# Neo4jクライアント関連クラス（初回のNeo4jService生成時に遅延インポート）
+Neo4jClient: Any = None
+Neo4jSettings: Any = None
+
+
+def _load_client_classes() -> None:
+    """Neo4jクライアント関連クラスを初回利用時にインポート
+
+    Neo4jドライバの読み込みは重いため、
+    モジュール読み込み時ではなく最初のサービス生成時に読み込む。
+    """
+    global Neo4jClient, Neo4jSettings
+    if Neo4jClient is not None:
+        return
+
+    from inheritance_calculator_core.database.neo4j_client import Neo4jClient as _Neo4jClient
+    from inheritance_calculator_core.utils.config import Neo4jSettings as _Neo4jSettings
+
+    Neo4jSettings = _Neo4jSettings
+    Neo4jClient = _Neo4jClient
 
 
 class Neo4jService:
@@ -24,6 +36,8 @@ class Neo4jService:
 
     def __init__(self) -> None:
         """初期化"""
+        _load_client_classes()
+
         # バックエンド設定から既存のNeo4jClientを初期化
         neo4j_settings = Neo4jSettings(
             uri=settings.neo4j_uri,
@@ -108,6 +122,47 @@ class Neo4jService:
         result = self.execute_query(query, {"case_id": case_id})
         return result[0]["c"] if result else None
 
+    def get_case_with_persons(self, case_id: str) -> tuple[Optional[dict[str, Any]], list[dict[str, Any]]]:
+        """Case節点と配下の全Person節点を1回のクエリで取得
+
+        Args:
+            case_id: 案件ID
+
+        Returns:
+            tuple[Optional[dict[str, Any]], list[dict[str, Any]]]: (Case節点, Person節点リスト)、
+                案件が存在しない場合は(None, [])
+        """
+        query = """
+        MATCH (c:Case {id: $case_id})
+        OPTIONAL MATCH (c)-[:HAS_PERSON]->(p:Person)
+        RETURN c, collect(p) AS persons
+        """
+        result = self.execute_query(query, {"case_id": case_id})
+        if not result:
+            return None, []
+        return result[0]["c"], result[0]["persons"]
+
+    def get_case_with_decedent(self, case_id: str) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+        """Case節点と被相続人節点を1回のクエリで取得
+
+        Args:
+            case_id: 案件ID
+
+        Returns:
+            tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]: (Case節点, 被相続人節点)。
+                Caseが存在しない場合は(None, None)
+        """
+        query = """
+        MATCH (c:Case {id: $case_id})
+        OPTIONAL MATCH (c)-[:HAS_PERSON]->(d:Person {is_decedent: true})
+        RETURN c, d
+        LIMIT 1
+        """
+        result = self.execute_query(query, {"case_id": case_id})
+        if not result:
+            return None, None
+        return result[0]["c"], result[0]["d"]
+
     def get_all_cases(self) -> list[dict[str, Any]]:
         """全Case取得
 
@@ -122,6 +177,49 @@ class Neo4jService:
         result = self.execute_query(query)
         return [record["c"] for record in result]
 
+    def get_cases_with_decedent(
+        self, skip: int = 0, limit: Optional[int] = None
+    ) -> list[tuple[dict[str, Any], Optional[dict[str, Any]]]]:
+        """Caseを被相続人と合わせて取得
+
+        Caseごとに人物一覧を取得し直す代わりに、1回のクエリで
+        Case節点と被相続人節点の組を返す。
+
+        Args:
+            skip: 読み飛ばす件数
+            limit: 取得する最大件数（Noneの場合は全件）
+
+        Returns:
+            list[tuple[dict[str, Any], Optional[dict[str, Any]]]]: (Case節点, 被相続人節点)のリスト
+        """
+        limit_clause = "LIMIT $limit" if limit is not None else ""
+        query = f"""
+        MATCH (c:Case)
+        WITH c
+        ORDER BY c.created_at DESC
+        SKIP $skip
+        {limit_clause}
+        OPTIONAL MATCH (c)-[:HAS_PERSON]->(d:Person {{is_decedent: true}})
+        WITH c, head(collect(d)) AS d
+        RETURN c, d
+        ORDER BY c.created_at DESC
+        """
+        result = self.execute_query(query, {"skip": skip, "limit": limit})
+        return [(record["c"], record["d"]) for record in result]
+
+    def count_cases(self) -> int:
+        """Case総数取得
+
+        Returns:
+            int: Case節点の総数
+        """
+        query = """
+        MATCH (c:Case)
+        RETURN count(c) AS total
+        """
+        result = self.execute_query(query)
+        return int(result[0]["total"]) if result else 0
+
     def update_case(self, case_id: str, updates: dict[str, Any]) -> Optional[dict[str, Any]]:
         """Case更新
 
@@ -132,18 +230,13 @@ class Neo4jService:
         Returns:
             Optional[dict[str, Any]]: 更新後のCase節点
         """
-        # SET句を動的生成
-        set_clauses = [f"c.{key} = ${key}" for key in updates.keys()]
-        set_clauses.append("c.updated_at = datetime()")
-        set_clause = ", ".join(set_clauses)
-
-        query = f"""
-        MATCH (c:Case {{id: $case_id}})
-        SET {set_clause}
+        # 更新内容をマップとして渡し、クエリ文字列を固定する（実行計画がキャッシュされる）
+        query = """
+        MATCH (c:Case {id: $case_id})
+        SET c += $updates, c.updated_at = datetime()
         RETURN c
         """
-        params = {"case_id": case_id, **updates}
-        result = self.execute_query(query, params)
+        result = self.execute_query(query, {"case_id": case_id, "updates": updates})
         return result[0]["c"] if result else None
 
     def delete_case(self, case_id: str) -> bool:
@@ -178,7 +271,7 @@ class Neo4jService:
             **kwargs: その他属性
 
         Returns:
-            dict[str, Any]: 作成されたPerson節点
+            dict[str, Any]: 作成されたPerson節点、案件が存在しない場合は空のdict
         """
         properties = {
             "id": person_id,
@@ -187,38 +280,57 @@ class Neo4jService:
             "is_decedent": is_decedent,
             **kwargs,
         }
+        nodes = self.create_person_nodes(case_id, [properties])
+        return nodes[0] if nodes else {}
 
-        # プロパティ文字列生成
-        props_str = ", ".join([f"{k}: ${k}" for k in properties.keys()])
+    def create_person_nodes(self, case_id: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """複数のPerson節点を1回のクエリで作成
 
-        query = f"""
-        MATCH (c:Case {{id: $case_id}})
-        CREATE (p:Person {{{props_str}}})
+        Args:
+            case_id: 所属案件ID
+            rows: 人物ごとの属性（id, name, is_alive, is_decedent など）のリスト
+
+        Returns:
+            list[dict[str, Any]]: 作成されたPerson節点（rowsと同じ順序）、案件が存在しない場合は空リスト
+        """
+        if not rows:
+            return []
+
+        # 案件の更新日時も更新（計算結果キャッシュの無効化に使用）
+        query = """
+        MATCH (c:Case {id: $case_id})
+        UNWIND $rows AS row
+        CREATE (p:Person)
+        SET p = row
         CREATE (c)-[:HAS_PERSON]->(p)
-        RETURN p
+        WITH c, collect(p) AS persons
+        SET c.updated_at = datetime()
+        RETURN persons
         """
-        params = {"case_id": case_id, **properties}
-        result = self.execute_query(query, params)
-        return result[0]["p"] if result else {}
+        result = self.execute_query(query, {"case_id": case_id, "rows": rows})
+        return result[0]["persons"] if result else []
 
-    def get_persons_by_case(self, case_id: str) -> list[dict[str, Any]]:
+    def get_persons_by_case(self, case_id: str, is_decedent: Optional[bool] = None) -> list[dict[str, Any]]:
         """Case配下の全Person取得
 
         Args:
             case_id: 案件ID
+            is_decedent: 指定した場合、被相続人かどうかで絞り込む
 
         Returns:
             list[dict[str, Any]]: Person節点リスト
         """
+        # 絞り込みの有無によらず同じクエリ文字列を使い、実行計画のキャッシュを効かせる
         query = """
         MATCH (c:Case {id: $case_id})-[:HAS_PERSON]->(p:Person)
+        WHERE $is_decedent IS NULL OR p.is_decedent = $is_decedent
         RETURN p
         """
-        result = self.execute_query(query, {"case_id": case_id})
+        result = self.execute_query(query, {"case_id": case_id, "is_decedent": is_decedent})
         return [record["p"] for record in result]
 
     def create_relationship(
-        self, from_person_id: str, to_person_id: str, rel_type: str, properties: Optional[dict[str, Any]] = None
+        self, from_person_id: str, to_person_id: str, rel_type: str, properties: Optional[Mapping[str, Any]] = None
     ) -> bool:
         """Person間の関係性作成
 
@@ -231,18 +343,49 @@ class Neo4jService:
         Returns:
             bool: 作成成功したらTrue
         """
-        props = properties or {}
-        props_str = ", ".join([f"{k}: ${k}" for k in props.keys()]) if props else ""
+        row = {"from_id": from_person_id, "to_id": to_person_id, "rel_type": rel_type, "properties": properties}
+        return self.create_relationships([row]) > 0
 
-        query = f"""
-        MATCH (from:Person {{id: $from_id}})
-        MATCH (to:Person {{id: $to_id}})
-        CREATE (from)-[r:{rel_type} {{{props_str}}}]->(to)
-        RETURN r
+    def create_relationships(self, rows: list[dict[str, Any]]) -> int:
+        """複数のPerson間の関係性をまとめて作成
+
+        リレーションシップ型はパラメータ化できないため、型ごとに1回のクエリで作成する。
+
+        Args:
+            rows: 関係性ごとの from_id, to_id, rel_type, properties（省略可）のリスト
+
+        Returns:
+            int: 作成された関係性の数
+
+        Raises:
+            ValueError: 未定義の関係性タイプが含まれる場合
         """
-        params = {"from_id": from_person_id, "to_id": to_person_id, **props}
-        result = self.execute_query(query, params)
-        return len(result) > 0
+        rows_by_type: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            rel_type = row["rel_type"]
+            if rel_type not in _RELATIONSHIP_TYPES:
+                raise ValueError(f"未定義の関係性タイプ: {rel_type}")
+            rows_by_type.setdefault(rel_type, []).append(
+                {"from_id": row["from_id"], "to_id": row["to_id"], "properties": dict(row.get("properties") or {})}
+            )
+
+        created = 0
+        for rel_type, type_rows in rows_by_type.items():
+            # 起点人物が属する案件の更新日時も更新（計算結果キャッシュの無効化に使用）
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (from:Person {{id: row.from_id}})
+            MATCH (to:Person {{id: row.to_id}})
+            CREATE (from)-[r:{rel_type}]->(to)
+            SET r += row.properties
+            WITH r, from
+            OPTIONAL MATCH (c:Case)-[:HAS_PERSON]->(from)
+            SET c.updated_at = datetime()
+            RETURN count(DISTINCT r) AS created
+            """
+            result = self.execute_query(query, {"rows": type_rows})
+            created += int(result[0]["created"]) if result else 0
+        return created
 
 
 # グローバルインスタンス（依存性注入用）
@@ -0,0 +1,14 @@
+"""テスト用フィクスチャの型定義
+
+conftest.pyはpytestのプラグインとして読み込まれるため、テストモジュールからは直接importせず、
+フィクスチャの型はこのモジュールから参照する。
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+# キャッシュ付きPOSTヘルパーの型（URLとJSONを受け取り、(ステータスコード, レスポンスJSON)を返す）
+CachedPost = Callable[[str, dict[str, Any]], tuple[int, Any]]
+
+# Case作成ヘルパーの型（キーワード引数で作成データを上書きし、作成された案件のJSONを返す）
+CaseFactory = Callable[..., dict[str, Any]]
@@ -0,0 +1,78 @@
+"""pytest共通フィクスチャ"""
+
+import os
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from tests._types import CachedPost, CaseFactory
+
+# Neo4jに接続するテストファイルは、NEO4J_URIが未設定なら収集自体を行わない
+if not os.getenv("NEO4J_URI"):
+    collect_ignore = ["test_api_cases.py"]
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """テストセッション全体で共有するTestClient"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def server_error_client() -> Iterator[TestClient]:
+    """サーバーエラーを例外として送出せず、500レスポンスとして返すTestClient"""
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client: TestClient) -> dict[str, Any]:
+    """OpenAPIスキーマ（テストセッション中に一度だけ取得）"""
+    response = client.get("/openapi.json")
+    response.raise_for_status()
+    schema: dict[str, Any] = response.json()
+    return schema
+
+
+@pytest.fixture(scope="session")
+def cached_post(client: TestClient) -> CachedPost:
+    """入力だけで結果が決まるエンドポイント用のPOST（同じ入力はテストセッション中に一度だけ送信）"""
+
+    @lru_cache(maxsize=256)
+    def _post(url: str, payload_key: tuple[tuple[str, Any], ...]) -> tuple[int, Any]:
+        response = client.post(url, json=dict(payload_key))
+        return response.status_code, response.json()
+
+    def _cached_post(url: str, payload: dict[str, Any]) -> tuple[int, Any]:
+        return _post(url, tuple(sorted(payload.items())))
+
+    return _cached_post
+
+
+@pytest.fixture
+def make_case(client: TestClient) -> Iterator[CaseFactory]:
+    """Case作成ファクトリ（作成した案件はテスト後に削除）"""
+    created_ids: list[str] = []
+
+    def _make_case(**overrides: Any) -> dict[str, Any]:
+        payload = {
+            "title": "テスト案件",
+            "description": "テスト用の案件です",
+            "decedent_name": "山田太郎",
+            "death_date": "令和5年6月15日",
+            **overrides,
+        }
+        response = client.post("/api/v1/cases/", json=payload)
+        assert response.status_code == 201
+        case: dict[str, Any] = response.json()
+        created_ids.append(case["id"])
+        return case
+
+    yield _make_case
+
+    # テスト内で削除済みの案件は404になるため、ステータスは確認しない
+    for case_id in created_ids:
+        client.delete(f"/api/v1/cases/{case_id}")
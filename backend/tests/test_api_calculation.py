@@ -0,0 +1,92 @@
+"""相続計算APIのテスト"""
+
+from collections.abc import Iterator
+import pytest
+from fastapi.testclient import TestClient
+from neo4j.exceptions import Neo4jError
+from app.main import app
+from app.schemas import CalculationResult
+from app.services.calculation_service import UnsupportedRelationshipError, get_calculation_service
+
+
+class StubCalculationService:
+    """案件IDに応じて結果またはエラーを返すテスト用サービス"""
+
+    def calculate_inheritance(self, case_id: str) -> CalculationResult:
+        if case_id == "missing":
+            raise ValueError(f"案件が見つかりません: {case_id}")
+        if case_id == "broken":
+            raise Neo4jError("接続エラー: bolt://neo4j:secret@db:7687")
+        if case_id == "slow":
+            raise TimeoutError("応答がありません")
+        if case_id == "unmapped":
+            raise UnsupportedRelationshipError("未対応の続柄です: nephew（山田次郎）")
+        if case_id == "bug":
+            raise RuntimeError("想定外のエラー: bolt://neo4j:secret@db:7687")
+        return CalculationResult(
+            case_id=case_id,
+            decedent_name="山田太郎",
+            heirs=[],
+            total_heirs=0,
+            calculation_basis="民法900条（法定相続分）",
+        )
+
+
+@pytest.fixture(autouse=True)
+def stub_calculation_service() -> Iterator[None]:
+    """CalculationServiceをスタブに差し替え"""
+    app.dependency_overrides[get_calculation_service] = StubCalculationService
+    yield
+    app.dependency_overrides.pop(get_calculation_service, None)
+
+
+class TestCalculationAPI:
+    """相続計算APIのテスト"""
+
+    def test_post_calculate(self, server_error_client: TestClient) -> None:
+        """POSTで計算結果が返される"""
+        response = server_error_client.post("/api/v1/calculation/calculate", json={"case_id": "case-123"})
+        assert response.status_code == 200
+        assert response.json()["case_id"] == "case-123"
+
+    def test_get_calculate(self, server_error_client: TestClient) -> None:
+        """GETで計算結果が返される"""
+        response = server_error_client.get("/api/v1/calculation/cases/case-123/calculate")
+        assert response.status_code == 200
+        assert response.json()["decedent_name"] == "山田太郎"
+
+    @pytest.mark.parametrize(
+        ("case_id", "status_code", "detail"),
+        [
+            ("missing", 404, "案件が見つかりません"),
+            ("broken", 500, "データベースエラーが発生しました"),
+            ("slow", 500, "処理がタイムアウトしました"),
+            ("unmapped", 500, "未対応の続柄です: nephew"),
+        ],
+    )
+    def test_errors_are_mapped(
+        self, server_error_client: TestClient, case_id: str, status_code: int, detail: str
+    ) -> None:
+        """サービスの例外がHTTPエラーに変換される"""
+        for response in (
+            server_error_client.post("/api/v1/calculation/calculate", json={"case_id": case_id}),
+            server_error_client.get(f"/api/v1/calculation/cases/{case_id}/calculate"),
+        ):
+            assert response.status_code == status_code
+            assert detail in response.json()["detail"]
+
+    def test_server_error_hides_internal_message_and_keeps_cors(self, server_error_client: TestClient) -> None:
+        """500エラーでも内部のエラー内容を返さず、CORSヘッダーが付与される"""
+        origin = "http://localhost:3000"
+        response = server_error_client.get("/api/v1/calculation/cases/broken/calculate", headers={"Origin": origin})
+
+        assert response.status_code == 500
+        assert "secret" not in response.text
+        assert response.headers["access-control-allow-origin"] == origin
+
+    def test_unexpected_error_returns_generic_500(self, server_error_client: TestClient) -> None:
+        """想定外の例外は内部のエラー内容を含まない500エラーになる"""
+        response = server_error_client.get("/api/v1/calculation/cases/bug/calculate")
+
+        assert response.status_code == 500
+        assert "secret" not in response.text
@@ -1,18 +1,32 @@
 """Case管理APIのテスト"""
 
+from collections.abc import Iterator
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
+from tests._types import CaseFactory
 
 # Note: これらのテストは実際のNeo4jデータベースに接続することを想定しています
-# Neo4jが起動していない場合はスキップされます
+# NEO4J_URIが未設定の場合はconftest.pyで収集対象から除外されます
+
+pytestmark = pytest.mark.neo4j
+
+# クラス内のCRUDテストで共有する案件
+_SHARED_CASE = {
+    "title": "CRUDテスト",
+    "description": "CRUDテスト用の共有案件",
+    "decedent_name": "渡辺五郎",
+    "death_date": "R5.10.3",
+}
 
-pytestmark = pytest.mark.skipif(
-    True,  # CI環境などでNeo4jがない場合はスキップ
-    reason="Neo4j integration tests require running Neo4j instance",
-)
+
+@pytest.fixture(scope="class")
+def case_id(client: TestClient) -> Iterator[str]:
+    """テストクラスで共有する案件ID（クラス終了時に削除）"""
+    response = client.post("/api/v1/cases/", json=_SHARED_CASE)
+    assert response.status_code == 201
+    shared_case_id: str = response.json()["id"]
+    yield shared_case_id
+    client.delete(f"/api/v1/cases/{shared_case_id}")
 
 
 class TestCaseAPI:
@@ -27,26 +41,16 @@ class TestCaseAPI:
         # テスト後: クリーンアップ
         pass
 
-    def test_create_case(self) -> None:
+    def test_create_case(self, make_case: CaseFactory) -> None:
         """Case作成のテスト"""
-        response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "テスト案件",
-                "description": "テスト用の案件です",
-                "decedent_name": "山田太郎",
-                "death_date": "令和5年6月15日",
-            },
-        )
-        assert response.status_code == 201
-        data = response.json()
+        data = make_case()
         assert data["title"] == "テスト案件"
         assert data["decedent_name"] == "山田太郎"
         assert data["status"] == "draft"
         assert "id" in data
         assert "created_at" in data
 
-    def test_create_case_invalid_death_date(self) -> None:
+    def test_create_case_invalid_death_date(self, client: TestClient) -> None:
         """不正な死亡日でCase作成エラー"""
         response = client.post(
             "/api/v1/cases/",
@@ -60,7 +64,7 @@ class TestCaseAPI:
         assert response.status_code == 400
         assert "死亡日の形式が不正" in response.json()["detail"]
 
-    def test_list_cases(self) -> None:
+    def test_list_cases(self, client: TestClient) -> None:
         """Case一覧取得のテスト"""
         response = client.get("/api/v1/cases/")
         assert response.status_code == 200
@@ -69,49 +73,23 @@ class TestCaseAPI:
         assert "total" in data
         assert isinstance(data["cases"], list)
 
-    def test_get_case(self) -> None:
+    def test_get_case(self, client: TestClient, case_id: str) -> None:
         """Case詳細取得のテスト"""
-        # まずCase作成
-        create_response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "詳細取得テスト",
-                "description": "詳細取得用",
-                "decedent_name": "田中花子",
-                "death_date": "2023-10-03",
-            },
-        )
-        assert create_response.status_code == 201
-        case_id = create_response.json()["id"]
-
         # Case詳細取得
         response = client.get(f"/api/v1/cases/{case_id}")
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == case_id
-        assert data["title"] == "詳細取得テスト"
+        assert data["decedent_name"] == _SHARED_CASE["decedent_name"]
 
-    def test_get_case_not_found(self) -> None:
+    def test_get_case_not_found(self, client: TestClient) -> None:
         """存在しないCase取得でエラー"""
         response = client.get("/api/v1/cases/nonexistent-id")
         assert response.status_code == 404
         assert "案件が見つかりません" in response.json()["detail"]
 
-    def test_update_case(self) -> None:
+    def test_update_case(self, client: TestClient, case_id: str) -> None:
         """Case更新のテスト"""
-        # まずCase作成
-        create_response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "更新テスト",
-                "description": "更新前",
-                "decedent_name": "佐藤一郎",
-                "death_date": "H31.4.30",
-            },
-        )
-        assert create_response.status_code == 201
-        case_id = create_response.json()["id"]
-
         # Case更新
         response = client.patch(
             f"/api/v1/cases/{case_id}",
@@ -127,20 +105,15 @@ class TestCaseAPI:
         assert data["description"] == "更新後の説明"
         assert data["status"] == "in_progress"
 
-    def test_delete_case(self) -> None:
+    def test_delete_case(self, client: TestClient, make_case: CaseFactory) -> None:
         """Case削除のテスト"""
         # まずCase作成
-        create_response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "削除テスト",
-                "description": "削除用",
-                "decedent_name": "鈴木二郎",
-                "death_date": "S64.1.7",
-            },
-        )
-        assert create_response.status_code == 201
-        case_id = create_response.json()["id"]
+        case_id = make_case(
+            title="削除テスト",
+            description="削除用",
+            decedent_name="鈴木二郎",
+            death_date="S64.1.7",
+        )["id"]
 
         # Case削除
         response = client.delete(f"/api/v1/cases/{case_id}")
@@ -150,21 +123,8 @@ class TestCaseAPI:
         get_response = client.get(f"/api/v1/cases/{case_id}")
         assert get_response.status_code == 404
 
-    def test_create_person(self) -> None:
+    def test_create_person(self, client: TestClient, case_id: str) -> None:
         """Person追加のテスト"""
-        # まずCase作成
-        create_case_response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "Person追加テスト",
-                "description": "Person追加用",
-                "decedent_name": "高橋三郎",
-                "death_date": "R5.10.3",
-            },
-        )
-        assert create_case_response.status_code == 201
-        case_id = create_case_response.json()["id"]
-
         # Person追加
         response = client.post(
             f"/api/v1/cases/{case_id}/persons",
@@ -183,21 +143,8 @@ class TestCaseAPI:
         assert data["is_decedent"] is False
         assert "id" in data
 
-    def test_list_persons(self) -> None:
+    def test_list_persons(self, client: TestClient, case_id: str) -> None:
         """Person一覧取得のテスト"""
-        # まずCase作成
-        create_case_response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "Person一覧テスト",
-                "description": "Person一覧用",
-                "decedent_name": "渡辺五郎",
-                "death_date": "2023-01-01",
-            },
-        )
-        assert create_case_response.status_code == 201
-        case_id = create_case_response.json()["id"]
-
         # Person一覧取得
         response = client.get(f"/api/v1/cases/{case_id}/persons")
         assert response.status_code == 200
@@ -206,25 +153,13 @@ class TestCaseAPI:
         # 被相続人が自動作成されているはず
         assert len(data) >= 1
         # 被相続人を確認
-        decedent = next((p for p in data if p["is_decedent"]), None)
-        assert decedent is not None
-        assert decedent["name"] == "渡辺五郎"
+        decedent_response = client.get(f"/api/v1/cases/{case_id}/persons", params={"is_decedent": True})
+        assert decedent_response.status_code == 200
+        (decedent,) = decedent_response.json()
+        assert decedent["name"] == _SHARED_CASE["decedent_name"]
 
-    def test_create_relationship(self) -> None:
+    def test_create_relationship(self, client: TestClient, case_id: str) -> None:
         """Relationship追加のテスト"""
-        # まずCase作成
-        create_case_response = client.post(
-            "/api/v1/cases/",
-            json={
-                "title": "Relationship追加テスト",
-                "description": "Relationship追加用",
-                "decedent_name": "伊藤六郎",
-                "death_date": "R5.5.1",
-            },
-        )
-        assert create_case_response.status_code == 201
-        case_id = create_case_response.json()["id"]
-
         # Person追加
         person1_response = client.post(
             f"/api/v1/cases/{case_id}/persons",
@@ -238,10 +173,8 @@ class TestCaseAPI:
         person1_id = person1_response.json()["id"]
 
         # 被相続人のIDを取得
-        persons_response = client.get(f"/api/v1/cases/{case_id}/persons")
-        decedent = next((p for p in persons_response.json() if p["is_decedent"]), None)
-        assert decedent is not None
-        decedent_id = decedent["id"]
+        persons_response = client.get(f"/api/v1/cases/{case_id}/persons", params={"is_decedent": True})
+        decedent_id = persons_response.json()[0]["id"]
 
         # Relationship追加（子の関係）
         response = client.post(
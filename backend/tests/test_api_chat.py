@@ -0,0 +1,129 @@
+"""Chat APIのテスト"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Iterator
+import pytest
+from app.api.v1 import chat
+from app.api.v1.chat import _SYSTEM_PROMPT, ChatSession, _extract_user_message, _response_cache
+
+
+class StubOllamaClient:
+    """generate呼び出しを記録するテスト用クライアント"""
+
+    def __init__(self, reply: str = " 次の質問です ") -> None:
+        self.reply = reply
+        self.calls: list[dict[str, str]] = []
+        self.thread_ids: list[int] = []
+
+    def generate(self, prompt: str, system_prompt: str) -> str:
+        self.calls.append({"prompt": prompt, "system_prompt": system_prompt})
+        self.thread_ids.append(threading.get_ident())
+        return self.reply
+
+
+def _make_session(client: StubOllamaClient) -> ChatSession:
+    """Ollamaに接続せずにChatSessionを生成"""
+    session = ChatSession.__new__(ChatSession)
+    session.case_id = "case-test"
+    session.ollama_client = client
+    session.conversation_history = deque(maxlen=10)
+    return session
+
+
+class TestChatSession:
+    """ChatSessionのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def clear_response_cache(self) -> Iterator[None]:
+        """テスト間で応答キャッシュを共有しない"""
+        _response_cache.clear()
+        yield
+        _response_cache.clear()
+
+    def test_process_message_returns_stripped_reply(self) -> None:
+        """応答が整形されて返り、履歴に追加される"""
+        client = StubOllamaClient()
+        session = _make_session(client)
+
+        response = asyncio.run(session.process_message("父が亡くなりました"))
+
+        assert response["type"] == "message"
+        assert response["content"] == "次の質問です"
+        assert response["case_id"] == "case-test"
+        assert [m["role"] for m in session.conversation_history] == ["user", "assistant"]
+        assert "ユーザー: 父が亡くなりました" in client.calls[0]["prompt"]
+        assert client.calls[0]["system_prompt"] == _SYSTEM_PROMPT
+
+    def test_process_message_runs_generate_off_event_loop(self) -> None:
+        """generateはイベントループのスレッド外で実行される"""
+        client = StubOllamaClient()
+        session = _make_session(client)
+
+        asyncio.run(session.process_message("こんにちは"))
+
+        assert client.thread_ids[0] != threading.get_ident()
+
+    def test_conversation_history_is_bounded(self) -> None:
+        """会話履歴は上限件数を超えて保持されない"""
+        client = StubOllamaClient()
+        session = _make_session(client)
+
+        for i in range(8):
+            asyncio.run(session.process_message(f"メッセージ{i}"))
+
+        assert len(session.conversation_history) == 10
+        assert "メッセージ0" not in client.calls[-1]["prompt"]
+        assert "メッセージ7" in client.calls[-1]["prompt"]
+
+    def test_identical_prompt_reuses_cached_reply(self) -> None:
+        """同じプロンプトになる場合はセッションをまたいでLLM呼び出しを省略する"""
+        client = StubOllamaClient()
+
+        first = asyncio.run(_make_session(client).process_message("こんにちは"))
+        second = asyncio.run(_make_session(client).process_message("こんにちは"))
+        asyncio.run(_make_session(client).process_message("父が亡くなりました"))
+
+        assert second["content"] == first["content"] == "次の質問です"
+        assert len(client.calls) == 2
+
+
+class TestSharedOllamaClient:
+    """Ollamaクライアント共有のテスト"""
+
+    def test_sessions_share_one_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """複数のChatSessionで同じOllamaクライアントを使い、生成は1回だけ"""
+        created: list[object] = []
+
+        def fake_client(settings: object) -> StubOllamaClient:
+            created.append(settings)
+            return StubOllamaClient()
+
+        monkeypatch.setattr(chat, "_ollama_client", None)
+        monkeypatch.setattr(chat, "InterviewAgent", lambda client: None)
+        monkeypatch.setattr(chat, "OllamaClient", fake_client)
+        monkeypatch.setattr(chat, "OllamaSettings", lambda **kwargs: kwargs)
+
+        first = ChatSession("case-1")
+        second = ChatSession("case-2")
+
+        assert first.ollama_client is second.ollama_client
+        assert len(created) == 1
+
+
+class TestExtractUserMessage:
+    """受信メッセージ解析のテスト"""
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ('{"message": "父が亡くなりました"}', "父が亡くなりました"),
+            ("父が亡くなりました", "父が亡くなりました"),
+            ('{"text": "こんにちは"}', '{"text": "こんにちは"}'),
+            ('"こんにちは"', '"こんにちは"'),
+        ],
+    )
+    def test_extract_user_message(self, data: str, expected: str) -> None:
+        """JSON形式ならmessageを、それ以外は受信文字列をそのまま返す"""
+        assert _extract_user_message(data) == expected
@@ -2,15 +2,15 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
+from tests._types import CachedPost
+from datetime import date
+from app.services.era_converter import EraConversionError, format_japanese_date, parse_japanese_date
 
 
 class TestEraConversionAPI:
     """元号変換APIのテスト"""
 
-    def test_root_endpoint(self) -> None:
+    def test_root_endpoint(self, client: TestClient) -> None:
         """ルートエンドポイントのテスト"""
         response = client.get("/")
         assert response.status_code == 200
@@ -18,120 +18,120 @@ class TestEraConversionAPI:
         assert "message" in data
         assert "version" in data
 
-    def test_health_check(self) -> None:
+    def test_health_check(self, client: TestClient) -> None:
         """ヘルスチェックのテスト"""
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
-    def test_convert_era_to_western_reiwa(self) -> None:
-        """令和を西暦に変換"""
-        response = client.post(
-            "/api/v1/utils/convert-era-to-western",
-            json={"date_str": "令和5年10月3日", "format_type": "long"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["original"] == "令和5年10月3日"
-        assert data["converted"] == "2023-10-03"
-        assert data["era_name"] == "令和"
-
-    def test_convert_era_to_western_short_format(self) -> None:
-        """R5.10.3形式を西暦に変換"""
-        response = client.post(
+    @pytest.mark.parametrize(
+        ("date_str", "format_type", "expected", "era_name"),
+        [
+            ("令和5年10月3日", "long", "2023-10-03", "令和"),
+            ("R5.10.3", "long", "2023-10-03", "令和"),
+            ("平成31年4月30日", "long", "2019-04-30", "平成"),
+            ("昭和64年1月7日", "long", "1989-01-07", "昭和"),
+        ],
+    )
+    def test_convert_era_to_western(
+        self, cached_post: CachedPost, date_str: str, format_type: str, expected: str, era_name: str
+    ) -> None:
+        """元号を西暦に変換"""
+        status_code, data = cached_post(
             "/api/v1/utils/convert-era-to-western",
-            json={"date_str": "R5.10.3", "format_type": "long"},
+            {"date_str": date_str, "format_type": format_type},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["original"] == "R5.10.3"
-        assert data["converted"] == "2023-10-03"
-        assert data["era_name"] == "令和"
-
-    def test_convert_western_to_era_long(self) -> None:
-        """西暦を元号(long)に変換"""
-        response = client.post(
-            "/api/v1/utils/convert-western-to-era",
-            json={"date_str": "2023-10-03", "format_type": "long"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["original"] == "2023-10-03"
-        assert data["converted"] == "令和5年10月3日"
-        assert data["era_name"] == "令和"
-
-    def test_convert_western_to_era_short(self) -> None:
-        """西暦を元号(short)に変換"""
-        response = client.post(
-            "/api/v1/utils/convert-western-to-era",
-            json={"date_str": "2023-10-03", "format_type": "short"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["original"] == "2023-10-03"
-        assert data["converted"] == "R5.10.3"
-        assert data["era_name"] == "令和"
-
-    def test_convert_western_to_era_slash(self) -> None:
-        """西暦を元号(slash)に変換"""
-        response = client.post(
+        assert status_code == 200
+        assert data["original"] == date_str
+        assert data["converted"] == expected
+        assert data["era_name"] == era_name
+
+    @pytest.mark.parametrize(
+        ("date_str", "format_type", "expected", "era_name"),
+        [
+            ("2023-10-03", "long", "令和5年10月3日", "令和"),
+            ("2023-10-03", "short", "R5.10.3", "令和"),
+            ("2023-10-03", "slash", "R5/10/3", "令和"),
+        ],
+    )
+    def test_convert_western_to_era(
+        self, cached_post: CachedPost, date_str: str, format_type: str, expected: str, era_name: str
+    ) -> None:
+        """西暦を元号に変換"""
+        status_code, data = cached_post(
             "/api/v1/utils/convert-western-to-era",
-            json={"date_str": "2023-10-03", "format_type": "slash"},
+            {"date_str": date_str, "format_type": format_type},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["original"] == "2023-10-03"
-        assert data["converted"] == "R5/10/3"
-        assert data["era_name"] == "令和"
-
-    def test_detect_and_convert_era_input(self) -> None:
-        """自動判定: 元号入力 → 西暦出力"""
-        response = client.post(
-            "/api/v1/utils/detect-and-convert",
-            json={"date_str": "令和5年10月3日", "format_type": "long"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["converted"] == "2023-10-03"
-
-    def test_detect_and_convert_western_input(self) -> None:
-        """自動判定: 西暦入力 → 元号出力"""
-        response = client.post(
+        assert status_code == 200
+        assert data["original"] == date_str
+        assert data["converted"] == expected
+        assert data["era_name"] == era_name
+
+    @pytest.mark.parametrize(
+        ("date_str", "expected"),
+        [
+            ("令和5年10月3日", "2023-10-03"),  # 元号入力 → 西暦出力
+            ("2023-10-03", "令和5年10月3日"),  # 西暦入力 → 元号出力
+            ("2023/10/03", "令和5年10月3日"),  # スラッシュ区切りの西暦入力 → 元号出力
+        ],
+    )
+    def test_detect_and_convert(self, cached_post: CachedPost, date_str: str, expected: str) -> None:
+        """入力形式を自動判定して変換"""
+        status_code, data = cached_post(
             "/api/v1/utils/detect-and-convert",
-            json={"date_str": "2023-10-03", "format_type": "long"},
+            {"date_str": date_str, "format_type": "long"},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["converted"] == "令和5年10月3日"
+        assert status_code == 200
+        assert data["converted"] == expected
 
-    def test_invalid_date_format(self) -> None:
+    def test_invalid_date_format(self, cached_post: CachedPost) -> None:
         """無効な日付形式でエラー"""
-        response = client.post(
+        status_code, data = cached_post(
             "/api/v1/utils/convert-era-to-western",
-            json={"date_str": "invalid-date", "format_type": "long"},
+            {"date_str": "invalid-date", "format_type": "long"},
         )
-        assert response.status_code == 400
-        data = response.json()
+        assert status_code == 400
         assert "detail" in data
 
-    def test_heisei_conversion(self) -> None:
-        """平成の変換テスト"""
-        response = client.post(
-            "/api/v1/utils/convert-era-to-western",
-            json={"date_str": "平成31年4月30日", "format_type": "long"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["converted"] == "2019-04-30"
-        assert data["era_name"] == "平成"
 
-    def test_showa_conversion(self) -> None:
-        """昭和の変換テスト"""
-        response = client.post(
-            "/api/v1/utils/convert-era-to-western",
-            json={"date_str": "昭和64年1月7日", "format_type": "long"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["converted"] == "1989-01-07"
-        assert data["era_name"] == "昭和"
+class TestEraConverterService:
+    """元号変換サービスのテスト"""
+
+    def test_parse_japanese_date_is_cached(self) -> None:
+        """同じ文字列の解析結果はキャッシュから返される"""
+        parse_japanese_date.cache_clear()
+        first = parse_japanese_date("令和5年10月3日")
+        second = parse_japanese_date("令和5年10月3日")
+        assert first == second
+        assert parse_japanese_date.cache_info().hits == 1
+
+    def test_format_japanese_date_is_cached(self) -> None:
+        """同じ日付・形式の変換結果はキャッシュから返される"""
+        format_japanese_date.cache_clear()
+        assert format_japanese_date(date(2023, 10, 3), "short") == "R5.10.3"
+        assert format_japanese_date(date(2023, 10, 3), "short") == "R5.10.3"
+        assert format_japanese_date.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        ("date_str", "expected"),
+        [
+            ("2023-10-03", date(2023, 10, 3)),
+            ("令和5年10月3日", date(2023, 10, 3)),
+            ("平成31年4月30日", date(2019, 4, 30)),
+            ("昭和64年1月7日", date(1989, 1, 7)),
+            ("令和５年１０月３日", date(2023, 10, 3)),
+            ("R5.10.3", date(2023, 10, 3)),
+            ("2023/10/03", date(2023, 10, 3)),
+        ],
+    )
+    def test_parse_japanese_date_formats(self, date_str: str, expected: date) -> None:
+        """高速パス・汎用処理のどちらでも同じ日付に解析される"""
+        parse_japanese_date.cache_clear()
+        assert parse_japanese_date(date_str) == expected
+
+    @pytest.mark.parametrize("date_str", ["平成31年5月1日", "昭和64年1月8日", "令和0年1月1日", "2023-02-30"])
+    def test_parse_japanese_date_out_of_range(self, date_str: str) -> None:
+        """元号の範囲外や存在しない日付はエラーになる"""
+        parse_japanese_date.cache_clear()
+        with pytest.raises(EraConversionError):
+            parse_japanese_date(date_str)
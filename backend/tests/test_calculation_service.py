@@ -0,0 +1,164 @@
+"""相続計算サービスのテスト"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, Optional
+import pytest
+from app.services import calculation_service
+from app.schemas import HeirInfo
+from app.services.calculation_service import CalculationService, UnsupportedRelationshipError
+
+
+@dataclass
+class StubHeir:
+    """相続人モデルのスタブ"""
+
+    name: str
+    relationship: str
+    is_substitute_heir: bool = False
+    original_heir: Optional[str] = None
+
+
+@dataclass
+class StubInheritanceResult:
+    """相続人判定結果のスタブ"""
+
+    heirs: list[StubHeir]
+
+
+class StubInheritanceCalculator:
+    """呼び出し回数を記録する相続人判定のスタブ"""
+
+    heirs: list[StubHeir] = []
+
+    def __init__(self, neo4j_settings: Any) -> None:
+        self.calls = 0
+
+    def calculate_inheritance(self, decedent_name: str) -> StubInheritanceResult:
+        self.calls += 1
+        return StubInheritanceResult(heirs=self.heirs)
+
+
+class StubShareCalculator:
+    """法定相続分（配偶者1/2、残りを子で均等）を返すスタブ"""
+
+    def calculate_shares(self, heirs: list[StubHeir]) -> dict[str, Fraction]:
+        children = [h for h in heirs if h.relationship == "child"]
+        shares = {h.name: Fraction(1, 2) for h in heirs if h.relationship == "spouse"}
+        for child in children:
+            shares[child.name] = Fraction(1, 2 * len(children))
+        return shares
+
+
+class StubNeo4jService:
+    """案件と人物をメモリ上に保持するNeo4jサービスのスタブ"""
+
+    def __init__(self) -> None:
+        self.updated_at = "2024-01-01T00:00:00"
+        self.persons = [
+            {"id": "person-a1", "name": "山田太郎", "is_decedent": True},
+            {"id": "person-b2", "name": "山田花子", "is_decedent": False},
+            {"id": "person-c3", "name": "山田一郎", "is_decedent": False},
+        ]
+
+    def get_case_with_persons(self, case_id: str) -> tuple[Optional[dict[str, Any]], list[dict[str, Any]]]:
+        if case_id != "case-123":
+            return None, []
+        return {"id": case_id, "updated_at": self.updated_at}, self.persons
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> CalculationService:
+    """Neo4jに接続しないCalculationServiceを生成"""
+    monkeypatch.setattr(calculation_service, "Neo4jSettings", dict)
+    monkeypatch.setattr(calculation_service, "InheritanceCalculator", StubInheritanceCalculator)
+    monkeypatch.setattr(calculation_service, "ShareCalculator", StubShareCalculator)
+    monkeypatch.setattr(
+        StubInheritanceCalculator,
+        "heirs",
+        [StubHeir("山田花子", "spouse"), StubHeir("山田一郎", "child")],
+    )
+    return CalculationService(StubNeo4jService())  # type: ignore[arg-type]
+
+
+class TestCalculationService:
+    """CalculationServiceのテスト"""
+
+    def test_calculate_inheritance(self, service: CalculationService) -> None:
+        """相続人と相続割合が返される"""
+        result = service.calculate_inheritance("case-123")
+
+        assert result.decedent_name == "山田太郎"
+        assert result.total_heirs == 2
+        spouse, child = result.heirs
+        assert (spouse.person_id, child.person_id) == ("person-b2", "person-c3")
+        assert result.calculation_basis == (
+            "民法890条（配偶者の相続権）、民法887条1項（子の相続権）、民法900条（法定相続分）"
+        )
+        assert (spouse.relationship, spouse.rank, spouse.share_percentage) == ("配偶者", 0, 50.0)
+        assert (child.relationship, child.rank, child.share_numerator, child.share_denominator) == ("子", 1, 1, 2)
+
+    def test_share_percentage_is_correctly_rounded(self, service: CalculationService) -> None:
+        """相続割合のパーセント表記は分数から直接計算される"""
+        service.calculator.heirs = [StubHeir("山田花子", "spouse")] + [
+            StubHeir(f"子{i}", "child") for i in range(3)
+        ]
+
+        result = service.calculate_inheritance("case-123")
+
+        child = result.heirs[1]
+        assert (child.share_numerator, child.share_denominator) == (1, 6)
+        assert child.share_percentage == 100 / 6
+
+    def test_missing_case(self, service: CalculationService) -> None:
+        """案件が存在しない場合はValueError"""
+        with pytest.raises(ValueError, match="案件が見つかりません"):
+            service.calculate_inheritance("missing")
+
+    def test_unmapped_relationship_raises(self, service: CalculationService) -> None:
+        """変換表にない続柄は配偶者扱いにせずエラーにする"""
+        service.calculator.heirs = [StubHeir("山田花子", "spouse"), StubHeir("山田次郎", "nephew")]
+
+        with pytest.raises(UnsupportedRelationshipError, match="未対応の続柄です: nephew"):
+            service.calculate_inheritance("case-123")
+
+    def test_result_is_cached_until_case_is_updated(self, service: CalculationService) -> None:
+        """案件の更新日時が変わるまでは計算結果がキャッシュされる"""
+        first = service.calculate_inheritance("case-123")
+        second = service.calculate_inheritance("case-123")
+        assert first == second
+        assert service.calculator.calls == 1
+
+        service.neo4j_service.updated_at = "2024-01-02T00:00:00"  # type: ignore[attr-defined]
+        service.calculate_inheritance("case-123")
+        assert service.calculator.calls == 2
+
+    def test_calculation_basis_without_children(self, service: CalculationService) -> None:
+        """子がいない場合も計算根拠を生成できる"""
+        heirs = [
+            HeirInfo(
+                person_id="person-b2",
+                name="山田花子",
+                relationship="配偶者",
+                rank=0,
+                share_numerator=3,
+                share_denominator=4,
+                share_percentage=75.0,
+            ),
+            HeirInfo(
+                person_id="person-d4",
+                name="山田次郎",
+                relationship="兄弟姉妹",
+                rank=3,
+                share_numerator=1,
+                share_denominator=4,
+                share_percentage=25.0,
+                is_substitute=True,
+                substitute_for="person-e5",
+            ),
+        ]
+
+        assert service._generate_calculation_basis(heirs) == (
+            "民法890条（配偶者の相続権）、民法889条1項2号（兄弟姉妹の相続権）、"
+            "民法889条2項（兄弟姉妹の代襲相続）、民法900条（法定相続分）"
+        )
@@ -0,0 +1,44 @@
+"""アプリケーション設定のテスト"""
+
+import pytest
+from app.core.config import Settings, get_settings, settings
+
+
+class TestGetSettings:
+    """get_settingsのテスト"""
+
+    def test_returns_cached_instance(self) -> None:
+        """同じインスタンスが返される"""
+        assert get_settings() is get_settings()
+        assert isinstance(settings, Settings)
+
+    def test_cache_clear_rereads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """cache_clear後は環境変数が再読み込みされる"""
+        monkeypatch.setenv("APP_NAME", "test-backend")
+        get_settings.cache_clear()
+        try:
+            reloaded = get_settings()
+            assert isinstance(reloaded, Settings)
+            assert reloaded.app_name == "test-backend"
+        finally:
+            get_settings.cache_clear()
+            monkeypatch.delenv("APP_NAME")
+            get_settings()
+
+
+class TestAllowedOrigins:
+    """CORS許可オリジン設定のテスト"""
+
+    def test_default_is_frozenset(self) -> None:
+        """デフォルト値はfrozensetで保持される"""
+        assert Settings().allowed_origins == frozenset({"http://localhost:3000", "http://localhost:3001"})
+
+    def test_comma_separated_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """.env.exampleと同じカンマ区切り形式を解釈できる"""
+        monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost:3000, https://example.com/")
+        assert Settings().allowed_origins == frozenset({"http://localhost:3000", "https://example.com"})
+
+    def test_json_array_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """JSON配列形式も解釈できる"""
+        monkeypatch.setenv("ALLOWED_ORIGINS", '["https://example.com"]')
+        assert Settings().allowed_origins == frozenset({"https://example.com"})
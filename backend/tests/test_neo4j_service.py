@@ -0,0 +1,95 @@
+"""Neo4jサービスのテスト"""
+
+from typing import Any, Optional
+import pytest
+from app.services.neo4j_service import Neo4jService
+
+
+class RecordingNeo4jService(Neo4jService):
+    """Neo4jに接続せず、実行したクエリを記録するNeo4jService"""
+
+    def __init__(self, results: Optional[list[list[dict[str, Any]]]] = None) -> None:
+        self.queries: list[tuple[str, dict[str, Any]]] = []
+        self.results = results or []
+
+    def execute_query(self, query: str, parameters: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
+        self.queries.append((query, parameters or {}))
+        return self.results.pop(0) if self.results else []
+
+
+class TestUpdateCase:
+    """Case更新のテスト"""
+
+    def test_updates_are_passed_as_map(self) -> None:
+        """更新項目によらず同じクエリ文字列を使う"""
+        service = RecordingNeo4jService(results=[[{"c": {"id": "case-123"}}], [{"c": {"id": "case-123"}}]])
+
+        service.update_case("case-123", {"title": "新しい案件名"})
+        service.update_case("case-123", {"status": "completed", "description": "説明"})
+
+        (first_query, first_params), (second_query, _) = service.queries
+        assert first_query == second_query
+        assert "SET c += $updates" in first_query
+        assert first_params == {"case_id": "case-123", "updates": {"title": "新しい案件名"}}
+
+
+class TestGetPersonsByCase:
+    """Case配下のPerson取得のテスト"""
+
+    def test_decedent_filter_is_passed_as_parameter(self) -> None:
+        """被相続人の絞り込み有無によらず同じクエリ文字列を使う"""
+        service = RecordingNeo4jService(results=[[{"p": {"id": "person-1"}}], [{"p": {"id": "person-1"}}]])
+
+        assert service.get_persons_by_case("case-123") == [{"id": "person-1"}]
+        assert service.get_persons_by_case("case-123", is_decedent=True) == [{"id": "person-1"}]
+
+        (all_query, all_params), (decedent_query, decedent_params) = service.queries
+        assert all_query == decedent_query
+        assert all_params == {"case_id": "case-123", "is_decedent": None}
+        assert decedent_params == {"case_id": "case-123", "is_decedent": True}
+
+
+class TestCreatePersonNodes:
+    """Person節点一括作成のテスト"""
+
+    def test_single_query_for_all_rows(self) -> None:
+        """全人物を1回のUNWINDクエリで作成する"""
+        rows = [{"id": "person-1", "name": "山田花子"}, {"id": "person-2", "name": "山田一郎"}]
+        service = RecordingNeo4jService(results=[[{"persons": rows}]])
+
+        assert service.create_person_nodes("case-123", rows) == rows
+        assert len(service.queries) == 1
+        query, params = service.queries[0]
+        assert "UNWIND $rows" in query
+        assert params == {"case_id": "case-123", "rows": rows}
+
+    def test_missing_case_returns_empty(self) -> None:
+        """案件が存在しない場合は単体作成も空のdictを返す"""
+        service = RecordingNeo4jService()
+        assert service.create_person_node("person-1", "missing", "山田花子", True, False) == {}
+
+
+class TestCreateRelationships:
+    """関係性一括作成のテスト"""
+
+    def test_one_query_per_relationship_type(self) -> None:
+        """関係性タイプごとに1回のクエリで作成する"""
+        service = RecordingNeo4jService(results=[[{"created": 2}], [{"created": 1}]])
+        rows: list[dict[str, Any]] = [
+            {"from_id": "person-2", "to_id": "person-1", "rel_type": "CHILD_OF", "properties": {"is_biological": True}},
+            {"from_id": "person-3", "to_id": "person-1", "rel_type": "CHILD_OF"},
+            {"from_id": "person-4", "to_id": "person-1", "rel_type": "SPOUSE_OF"},
+        ]
+
+        assert service.create_relationships(rows) == 3
+        assert len(service.queries) == 2
+        child_query, child_params = service.queries[0]
+        assert "[r:CHILD_OF]" in child_query
+        assert [row["properties"] for row in child_params["rows"]] == [{"is_biological": True}, {}]
+
+    def test_unknown_relationship_type(self) -> None:
+        """未定義の関係性タイプはクエリを実行せずに拒否する"""
+        service = RecordingNeo4jService()
+        with pytest.raises(ValueError, match="未定義の関係性タイプ"):
+            service.create_relationships([{"from_id": "a", "to_id": "b", "rel_type": "KNOWS"}])
+        assert service.queries == []
@@ -0,0 +1,89 @@
+"""Pydanticスキーマのテスト"""
+
+import pytest
+from pydantic import ValidationError
+from app.schemas import HeirInfo, PersonListAdapter, PersonResponse, RelationshipCreate
+
+
+class TestRelationshipCreate:
+    """関係性作成スキーマのテスト"""
+
+    def test_known_relationship_type(self) -> None:
+        """定義済みの関係性タイプと属性を受け付ける"""
+        rel = RelationshipCreate(
+            case_id="case-123",
+            from_person_id="person-1",
+            to_person_id="person-2",
+            relationship_type="CHILD_OF",
+            properties={"is_biological": True, "adoption": False},
+        )
+        assert rel.relationship_type == "CHILD_OF"
+        assert rel.properties == {"is_biological": True, "adoption": False}
+
+    def test_unknown_relationship_type(self) -> None:
+        """未定義の関係性タイプは拒否される"""
+        with pytest.raises(ValidationError):
+            RelationshipCreate(
+                case_id="case-123",
+                from_person_id="person-1",
+                to_person_id="person-2",
+                relationship_type="FRIEND_OF",  # type: ignore[arg-type]
+            )
+
+    def test_unknown_property(self) -> None:
+        """未定義の属性は拒否される"""
+        with pytest.raises(ValidationError):
+            RelationshipCreate(
+                case_id="case-123",
+                from_person_id="person-1",
+                to_person_id="person-2",
+                relationship_type="CHILD_OF",
+                properties={"is_biological": True, "order": 1},  # type: ignore[arg-type]
+            )
+
+
+class TestPersonListAdapter:
+    """人物リストアダプタのテスト"""
+
+    def test_validate_person_nodes(self) -> None:
+        """Neo4jの人物節点リストをまとめてPersonResponseに変換できる"""
+        persons = PersonListAdapter.validate_python(
+            [
+                {"id": "person-1", "name": "山田太郎", "is_alive": False, "is_decedent": True},
+                {"id": "person-2", "name": "山田花子", "is_alive": True, "is_decedent": False, "gender": "女性"},
+            ]
+        )
+        assert all(isinstance(p, PersonResponse) for p in persons)
+        assert [p.name for p in persons] == ["山田太郎", "山田花子"]
+        assert persons[1].gender == "女性"
+
+
+class TestHeirInfo:
+    """相続人情報スキーマのテスト"""
+
+    def test_is_frozen(self) -> None:
+        """生成後の変更は拒否される"""
+        heir = HeirInfo(
+            person_id="person-1",
+            name="山田花子",
+            relationship="配偶者",
+            rank=0,
+            share_numerator=1,
+            share_denominator=2,
+            share_percentage=50.0,
+        )
+        with pytest.raises(ValidationError):
+            heir.share_percentage = 100.0
+
+    def test_unknown_rank(self) -> None:
+        """相続順位は0-3のみ受け付ける"""
+        with pytest.raises(ValidationError):
+            HeirInfo(
+                person_id="person-1",
+                name="山田花子",
+                relationship="配偶者",
+                rank=4,  # type: ignore[arg-type]
+                share_numerator=1,
+                share_denominator=2,
+                share_percentage=50.0,
+            )
@@ -0,0 +1,95 @@
+"""デモ共通の相続計算機と相続結果表示
+
+各デモスクリプトで重複していた相続計算機の生成と、相続結果テーブル・計算根拠の表示をまとめたものです。
+"""
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Optional
+
+from inheritance_calculator_core.services.inheritance_calculator import InheritanceCalculator
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# 全デモで共有する相続計算機（calculate呼び出しごとに検証状態は再設定される）
+CALCULATOR = InheritanceCalculator()
+
+# 相続順位の表示名（未知の順位は「不明」）
+_RANK_NAMES: defaultdict[str, str] = defaultdict(
+    lambda: "不明",
+    {
+        "spouse": "配偶者",
+        "first": "第1順位",
+        "second": "第2順位",
+        "third": "第3順位",
+    },
+)
+
+# 氏名列以降の列定義（列名, スタイル, 幅）
+_SHARE_COLUMNS = (
+    ("続柄", "green", 15),
+    ("相続順位", "yellow", 15),
+    ("相続割合（分数）", "blue", 20),
+    ("相続割合（%）", "blue", 15),
+)
+
+
+class LazyConsole:
+    """初回の属性アクセス時にrichのConsoleを生成する代理オブジェクト
+
+    デモをモジュールとしてimportしただけでは、rich.consoleの読み込みと端末判定を行わない。
+    """
+
+    _console: Optional["Console"] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+def print_result_table(result, console: Optional["Console"] = None, name_width: int = 20) -> None:
+    """相続結果をテーブル形式で表示し、続けて計算根拠を表示
+
+    Args:
+        result: 相続計算結果
+        console: 出力先のConsole（省略時は新規作成）
+        name_width: 氏名列の幅
+    """
+    from rich.console import Console, Group
+    from rich.table import Table
+
+    if console is None:
+        console = Console()
+
+    table = Table(title="相続人と相続割合", show_header=True, header_style="bold magenta")
+    table.add_column("氏名", style="cyan", width=name_width)
+    for name, style, width in _SHARE_COLUMNS:
+        table.add_column(name, style=style, width=width)
+
+    # 表示用の文字列を先にまとめて整形してから行を追加
+    rows = [
+        (
+            str(heir.person),
+            heir.rank.value,
+            _RANK_NAMES[heir.rank.value],
+            str(heir.share),
+            f"{heir.share_percentage:.2f}%",
+        )
+        for heir in result.heirs
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    # テーブルと計算根拠をまとめて1回で出力
+    console.print(
+        Group(
+            table,
+            "",
+            "[bold]計算根拠:[/bold]",
+            *(f"  • {basis}" for basis in result.calculation_basis),
+            "",
+        )
+    )
@@ -3,57 +3,23 @@
 代襲相続、相続放棄、混合ケースなど、複雑な相続シナリオを実演します。
 """
 from datetime import date
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 from inheritance_calculator_core.models.person import Person
 from inheritance_calculator_core.models.relationship import BloodType
-from inheritance_calculator_core.services.inheritance_calculator import InheritanceCalculator
 
+from _display import CALCULATOR, LazyConsole, print_result_table
 
-console = Console()
+
+# richの読み込みは最初の出力まで遅延する
+console = LazyConsole()
 
 
 def print_header(title: str) -> None:
     """ヘッダーを表示"""
-    console.print()
-    console.print(Panel(f"[bold cyan]{title}[/bold cyan]", expand=False))
-    console.print()
-
-
-def print_result_table(result) -> None:
-    """相続結果をテーブル形式で表示"""
-    table = Table(title="相続人と相続割合", show_header=True, header_style="bold magenta")
-    table.add_column("氏名", style="cyan", width=20)
-    table.add_column("続柄", style="green", width=15)
-    table.add_column("相続順位", style="yellow", width=15)
-    table.add_column("相続割合（分数）", style="blue", width=20)
-    table.add_column("相続割合（%）", style="blue", width=15)
-
-    rank_names = {
-        "spouse": "配偶者",
-        "first": "第1順位",
-        "second": "第2順位",
-        "third": "第3順位",
-    }
-
-    for heir in result.heirs:
-        table.add_row(
-            str(heir.person),
-            heir.rank.value,
-            rank_names.get(heir.rank.value, "不明"),
-            str(heir.share),
-            f"{heir.share_percentage:.2f}%"
-        )
+    from rich.panel import Panel
 
-    console.print(table)
     console.print()
-
-    # 計算根拠を表示
-    console.print("[bold]計算根拠:[/bold]")
-    for basis in result.calculation_basis:
-        console.print(f"  • {basis}")
+    console.print(Panel(f"[bold cyan]{title}[/bold cyan]", expand=False))
     console.print()
 
 
@@ -95,19 +61,19 @@ def demo_case1_child_substitution():
         birth_date=date(2015, 7, 15)
     )
 
-    console.print(f"被相続人: {decedent}")
-    console.print(f"配偶者: {spouse}")
-    console.print(f"子1: {child1}")
-    console.print(f"[red]子2（先に死亡）: {child2_deceased}[/red]")
-    console.print(f"孫1（代襲相続人）: {grandchild1}")
-    console.print(f"孫2（代襲相続人）: {grandchild2}")
-    console.print()
-    console.print("[yellow]※子が被相続人より先に死亡した場合、その子（被相続人の孫）が代襲相続します[/yellow]")
-    console.print()
+    console.print(
+        f"被相続人: {decedent}\n"
+        f"配偶者: {spouse}\n"
+        f"子1: {child1}\n"
+        f"[red]子2（先に死亡）: {child2_deceased}[/red]\n"
+        f"孫1（代襲相続人）: {grandchild1}\n"
+        f"孫2（代襲相続人）: {grandchild2}\n"
+        "\n"
+        "[yellow]※子が被相続人より先に死亡した場合、その子（被相続人の孫）が代襲相続します[/yellow]\n"
+    )
 
-    calculator = InheritanceCalculator()
     # 代襲相続のシミュレーション: child2が先に死亡したため、その子が代襲
-    result = calculator.calculate(
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=[spouse],
         children=[child1, grandchild1, grandchild2],  # 孫を子として扱う
@@ -115,7 +81,7 @@ def demo_case1_child_substitution():
         siblings=[]
     )
 
-    print_result_table(result)
+    print_result_table(result, console)
 
 
 def demo_case2_sibling_substitution():
@@ -151,23 +117,23 @@ def demo_case2_sibling_substitution():
         birth_date=date(1975, 10, 10)
     )
 
-    console.print(f"被相続人: {decedent}")
-    console.print(f"配偶者: {spouse}")
-    console.print(f"[red]兄（先に死亡）: {brother_deceased}[/red]")
-    console.print(f"妹: {sister}")
-    console.print(f"甥（代襲相続人）: {nephew}")
-    console.print()
-    console.print("[yellow]※子も直系尊属もいないため、兄弟姉妹が相続人となります[/yellow]")
-    console.print("[yellow]※兄が先に死亡したため、その子（甥）が代襲相続します（1代限り）[/yellow]")
-    console.print()
+    console.print(
+        f"被相続人: {decedent}\n"
+        f"配偶者: {spouse}\n"
+        f"[red]兄（先に死亡）: {brother_deceased}[/red]\n"
+        f"妹: {sister}\n"
+        f"甥（代襲相続人）: {nephew}\n"
+        "\n"
+        "[yellow]※子も直系尊属もいないため、兄弟姉妹が相続人となります[/yellow]\n"
+        "[yellow]※兄が先に死亡したため、その子（甥）が代襲相続します（1代限り）[/yellow]\n"
+    )
 
     blood_types = {
         str(sister.id): BloodType.FULL,
         str(nephew.id): BloodType.FULL,  # 兄の代襲として全血扱い
     }
 
-    calculator = InheritanceCalculator()
-    result = calculator.calculate(
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=[spouse],
         children=[],
@@ -176,7 +142,7 @@ def demo_case2_sibling_substitution():
         sibling_blood_types=blood_types
     )
 
-    print_result_table(result)
+    print_result_table(result, console)
 
 
 def demo_case3_renunciation():
@@ -211,17 +177,17 @@ def demo_case3_renunciation():
         birth_date=date(1928, 9, 20)
     )
 
-    console.print(f"被相続人: {decedent}")
-    console.print(f"[red]子1（相続放棄）: {child1_renounced}[/red]")
-    console.print(f"[red]子2（相続放棄）: {child2_renounced}[/red]")
-    console.print(f"父: {father}")
-    console.print(f"母: {mother}")
-    console.print()
-    console.print("[yellow]※全ての子が相続放棄した場合、第2順位（直系尊属）が相続人となります[/yellow]")
-    console.print()
+    console.print(
+        f"被相続人: {decedent}\n"
+        f"[red]子1（相続放棄）: {child1_renounced}[/red]\n"
+        f"[red]子2（相続放棄）: {child2_renounced}[/red]\n"
+        f"父: {father}\n"
+        f"母: {mother}\n"
+        "\n"
+        "[yellow]※全ての子が相続放棄した場合、第2順位（直系尊属）が相続人となります[/yellow]\n"
+    )
 
-    calculator = InheritanceCalculator()
-    result = calculator.calculate(
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=[],
         children=[],  # 放棄したので子はいない扱い
@@ -230,7 +196,7 @@ def demo_case3_renunciation():
         renounced=[child1_renounced, child2_renounced]
     )
 
-    print_result_table(result)
+    print_result_table(result, console)
 
 
 def demo_case4_mixed_renunciation():
@@ -265,17 +231,17 @@ def demo_case4_mixed_renunciation():
         birth_date=date(1990, 12, 10)
     )
 
-    console.print(f"被相続人: {decedent}")
-    console.print(f"配偶者: {spouse}")
-    console.print(f"子1: {child1}")
-    console.print(f"[red]子2（相続放棄）: {child2_renounced}[/red]")
-    console.print(f"子3: {child3}")
-    console.print()
-    console.print("[yellow]※1人が放棄しても、他の子がいるため第1順位内で分割されます[/yellow]")
-    console.print()
+    console.print(
+        f"被相続人: {decedent}\n"
+        f"配偶者: {spouse}\n"
+        f"子1: {child1}\n"
+        f"[red]子2（相続放棄）: {child2_renounced}[/red]\n"
+        f"子3: {child3}\n"
+        "\n"
+        "[yellow]※1人が放棄しても、他の子がいるため第1順位内で分割されます[/yellow]\n"
+    )
 
-    calculator = InheritanceCalculator()
-    result = calculator.calculate(
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=[spouse],
         children=[child1, child3],  # child2は放棄したので除外
@@ -284,7 +250,7 @@ def demo_case4_mixed_renunciation():
         renounced=[child2_renounced]
     )
 
-    print_result_table(result)
+    print_result_table(result, console)
 
 
 def demo_case5_complex_mixed():
@@ -315,17 +281,17 @@ def demo_case5_complex_mixed():
         birth_date=date(1985, 8, 15)
     )
 
-    console.print(f"被相続人: {decedent}")
-    console.print(f"[red]子1（先に死亡）: {child1_deceased}[/red]")
-    console.print(f"孫（代襲相続人）: {grandchild}")
-    console.print(f"子2: {child2}")
-    console.print()
-    console.print("[yellow]※子1が先に死亡したため、その子（孫）が代襲相続します[/yellow]")
-    console.print("[yellow]※代襲相続人は被代襲者の相続分を承継します[/yellow]")
-    console.print()
+    console.print(
+        f"被相続人: {decedent}\n"
+        f"[red]子1（先に死亡）: {child1_deceased}[/red]\n"
+        f"孫（代襲相続人）: {grandchild}\n"
+        f"子2: {child2}\n"
+        "\n"
+        "[yellow]※子1が先に死亡したため、その子（孫）が代襲相続します[/yellow]\n"
+        "[yellow]※代襲相続人は被代襲者の相続分を承継します[/yellow]\n"
+    )
 
-    calculator = InheritanceCalculator()
-    result = calculator.calculate(
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=[],
         children=[grandchild, child2],  # 孫は代襲として子扱い
@@ -333,7 +299,7 @@ def demo_case5_complex_mixed():
         siblings=[]
     )
 
-    print_result_table(result)
+    print_result_table(result, console)
 
 
 def demo_case6_spouse_only_after_renunciation():
@@ -363,16 +329,16 @@ def demo_case6_spouse_only_after_renunciation():
         birth_date=date(1985, 8, 15)
     )
 
-    console.print(f"被相続人: {decedent}")
-    console.print(f"配偶者: {spouse}")
-    console.print(f"[red]子1（相続放棄）: {child1_renounced}[/red]")
-    console.print(f"[red]子2（相続放棄）: {child2_renounced}[/red]")
-    console.print()
-    console.print("[yellow]※全ての子が相続放棄し、他の相続人もいない場合、配偶者が全部相続します[/yellow]")
-    console.print()
+    console.print(
+        f"被相続人: {decedent}\n"
+        f"配偶者: {spouse}\n"
+        f"[red]子1（相続放棄）: {child1_renounced}[/red]\n"
+        f"[red]子2（相続放棄）: {child2_renounced}[/red]\n"
+        "\n"
+        "[yellow]※全ての子が相続放棄し、他の相続人もいない場合、配偶者が全部相続します[/yellow]\n"
+    )
 
-    calculator = InheritanceCalculator()
-    result = calculator.calculate(
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=[spouse],
         children=[],  # 全員放棄
@@ -381,11 +347,13 @@ def demo_case6_spouse_only_after_renunciation():
         renounced=[child1_renounced, child2_renounced]
     )
 
-    print_result_table(result)
+    print_result_table(result, console)
 
 
 def main():
     """メイン実行"""
+    from rich.panel import Panel
+
     console.print()
     console.print(Panel.fit(
         "[bold green]日本の民法に基づく相続計算デモ[/bold green]\n"
@@ -15,6 +15,10 @@ from rich.console import Console
 
 console = Console()
 
+# デモで使う相続割合（Fractionは不変のため、複数の相続人で共有する）
+_HALF = Fraction(1, 2)
+_QUARTER = Fraction(1, 4)
+
 
 def main():
     """デモメイン関数"""
@@ -57,21 +61,21 @@ def main():
         Heir(
             person=spouse,
             rank=HeritageRank.SPOUSE,
-            share=Fraction(1, 2),
+            share=_HALF,
             share_percentage=50.0,
             substitution_type=SubstitutionType.NONE
         ),
         Heir(
             person=child1,
             rank=HeritageRank.FIRST,
-            share=Fraction(1, 4),
+            share=_QUARTER,
             share_percentage=25.0,
             substitution_type=SubstitutionType.NONE
         ),
         Heir(
             person=child2,
             rank=HeritageRank.FIRST,
-            share=Fraction(1, 4),
+            share=_QUARTER,
             share_percentage=25.0,
             substitution_type=SubstitutionType.NONE
         ),
@@ -2,25 +2,35 @@
 
 ユーザーとの対話を通じて相続情報を収集し、相続計算を行います。
 """
+import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import List, Optional, Dict
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
 from inheritance_calculator_core.models.person import Person
 from inheritance_calculator_core.models.relationship import BloodType
-from inheritance_calculator_core.services.inheritance_calculator import InheritanceCalculator
+
+from _display import CALCULATOR, print_result_table
 
 
 console = Console()
 
+# 相続放棄者の氏名入力の区切り（カンマ前後の空白ごと分割する）
+_SPLIT_NAMES = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=256)
+def _parse_date_raw(date_str: str) -> date:
+    """日付文字列をdateオブジェクトに変換（不正な形式はValueError）"""
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
 
 def parse_date(date_str: str) -> Optional[date]:
     """日付文字列をdateオブジェクトに変換"""
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        return _parse_date_raw(date_str)
     except ValueError:
         console.print("[red]無効な日付形式です。YYYY-MM-DD形式で入力してください。[/red]")
         return None
@@ -85,6 +95,11 @@ def input_multiple_persons(role: str) -> List[Person]:
     return persons
 
 
+def deceased_before(persons: List[Person], cutoff: date) -> List[Person]:
+    """基準日より前に死亡した人物を抽出（代襲相続の確認用）"""
+    return [p for p in persons if not p.is_alive and (d := p.death_date) and d < cutoff]
+
+
 def input_blood_types(siblings: List[Person]) -> Dict[str, BloodType]:
     """兄弟姉妹の血縁タイプを入力"""
     blood_types = {}
@@ -110,6 +125,8 @@ def input_blood_types(siblings: List[Person]) -> Dict[str, BloodType]:
 
 def display_result(result) -> None:
     """計算結果を表示"""
+    from rich.panel import Panel
+
     console.print()
     console.print(Panel.fit(
         "[bold green]相続計算結果[/bold green]",
@@ -117,51 +134,24 @@ def display_result(result) -> None:
     ))
     console.print()
 
-    # 相続人一覧テーブル
-    table = Table(title="相続人と相続割合", show_header=True, header_style="bold magenta")
-    table.add_column("氏名", style="cyan", width=25)
-    table.add_column("続柄", style="green", width=15)
-    table.add_column("相続順位", style="yellow", width=15)
-    table.add_column("相続割合（分数）", style="blue", width=20)
-    table.add_column("相続割合（%）", style="blue", width=15)
-
-    rank_names = {
-        "spouse": "配偶者",
-        "first": "第1順位",
-        "second": "第2順位",
-        "third": "第3順位",
-    }
-
-    for heir in result.heirs:
-        table.add_row(
-            str(heir.person),
-            heir.rank.value,
-            rank_names.get(heir.rank.value, "不明"),
-            str(heir.share),
-            f"{heir.share_percentage:.2f}%"
-        )
-
-    console.print(table)
-    console.print()
-
-    # 計算根拠
-    console.print("[bold]計算根拠:[/bold]")
-    for basis in result.calculation_basis:
-        console.print(f"  • {basis}")
-    console.print()
-
-    # サマリー情報
-    console.print("[bold]サマリー:[/bold]")
-    console.print(f"  • 相続人総数: {result.total_heirs}名")
-    console.print(f"  • 配偶者: {'あり' if result.has_spouse else 'なし'}")
-    console.print(f"  • 子: {'あり' if result.has_children else 'なし'}")
-    console.print(f"  • 直系尊属: {'あり' if result.has_parents else 'なし'}")
-    console.print(f"  • 兄弟姉妹: {'あり' if result.has_siblings else 'なし'}")
-    console.print()
+    # 相続人一覧テーブルと計算根拠
+    print_result_table(result, console, name_width=25)
+
+    # サマリー情報（複数行をまとめて1回で出力）
+    console.print(
+        "[bold]サマリー:[/bold]\n"
+        f"  • 相続人総数: {result.total_heirs}名\n"
+        f"  • 配偶者: {'あり' if result.has_spouse else 'なし'}\n"
+        f"  • 子: {'あり' if result.has_children else 'なし'}\n"
+        f"  • 直系尊属: {'あり' if result.has_parents else 'なし'}\n"
+        f"  • 兄弟姉妹: {'あり' if result.has_siblings else 'なし'}\n"
+    )
 
 
 def main():
     """メイン実行"""
+    from rich.panel import Panel
+
     console.print()
     console.print(Panel.fit(
         "[bold green]相続人・相続割合確定システム[/bold green]\n"
@@ -189,7 +179,7 @@ def main():
 
     # 先に死亡した子がいるか確認（代襲相続の可能性）
     if children:
-        deceased_children = [c for c in children if not c.is_alive and c.death_date and c.death_date < decedent.death_date]
+        deceased_children = deceased_before(children, decedent.death_date)
         if deceased_children:
             console.print()
             console.print("[yellow]※被相続人より先に死亡した子がいます。代襲相続の可能性があります。[/yellow]")
@@ -218,7 +208,7 @@ def main():
 
         if siblings:
             # 先に死亡した兄弟姉妹がいるか確認（代襲相続の可能性）
-            deceased_siblings = [s for s in siblings if not s.is_alive and s.death_date and s.death_date < decedent.death_date]
+            deceased_siblings = deceased_before(siblings, decedent.death_date)
             if deceased_siblings:
                 console.print()
                 console.print("[yellow]※被相続人より先に死亡した兄弟姉妹がいます。代襲相続の可能性があります（1代限り）。[/yellow]")
@@ -237,11 +227,13 @@ def main():
     renounced = []
     if has_renunciation:
         console.print("[yellow]相続放棄した人の氏名をカンマ区切りで入力してください[/yellow]")
-        renounced_names = Prompt.ask("氏名").split(",")
-        all_persons = spouses + children + parents + siblings
+        renounced_names = [n for n in _SPLIT_NAMES.split(Prompt.ask("氏名").strip()) if n]
+        # 氏名→人物の索引（同名の場合は従来どおり最初に入力された人物を優先）
+        by_name: Dict[str, Person] = {}
+        for p in spouses + children + parents + siblings:
+            by_name.setdefault(p.name, p)
         for name in renounced_names:
-            name = name.strip()
-            person = next((p for p in all_persons if p.name == name), None)
+            person = by_name.get(name)
             if person:
                 renounced.append(person)
 
@@ -249,15 +241,17 @@ def main():
     console.print()
     console.print("[bold cyan]相続計算を実行しています...[/bold cyan]")
 
-    calculator = InheritanceCalculator()
-    result = calculator.calculate(
+    # 空のリスト・辞書は「指定なし」としてNoneで渡す
+    renounced_arg = renounced or None
+    blood_types_arg = sibling_blood_types or None
+    result = CALCULATOR.calculate(
         decedent=decedent,
         spouses=spouses,
         children=children,
         parents=parents,
         siblings=siblings,
-        renounced=renounced if renounced else None,
-        sibling_blood_types=sibling_blood_types if sibling_blood_types else None
+        renounced=renounced_arg,
+        sibling_blood_types=blood_types_arg
     )
 
     # 結果の表示
@@ -1,18 +1,28 @@
 """CLIモジュール
 
 コマンドラインインターフェースの実装
+
+公開関数は初回アクセス時にインポートする（PEP 562）。
+パッケージのimportだけでdisplay/mainとその依存（rich等）を読み込まないようにする。
+なお、サブモジュールsrc.cli.mainを先にimportした場合、属性mainはそのサブモジュールを指すため、
+関数が必要な場合は from src.cli.main import main を使うこと。
 """
-from src.cli.display import (
-    display_completion,
-    display_error,
-    display_family_tree,
-    display_header,
-    display_info,
-    display_result,
-    display_success,
-    display_warning,
-)
-from src.cli.main import cli_entry_point, main
+from importlib import import_module
+from typing import Any
+
+# 公開名 → 定義元モジュール
+_LAZY_ATTRS = {
+    "main": "src.cli.main",
+    "cli_entry_point": "src.cli.main",
+    "display_result": "src.cli.display",
+    "display_family_tree": "src.cli.display",
+    "display_error": "src.cli.display",
+    "display_warning": "src.cli.display",
+    "display_info": "src.cli.display",
+    "display_success": "src.cli.display",
+    "display_header": "src.cli.display",
+    "display_completion": "src.cli.display",
+}
 
 __all__ = [
     "main",
@@ -26,3 +36,30 @@ __all__ = [
     "display_header",
     "display_completion",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """公開関数を初回アクセス時に定義元からインポート
+
+    Args:
+        name: 属性名
+
+    Returns:
+        Any: 定義元モジュールの同名属性
+
+    Raises:
+        AttributeError: 公開名以外が指定された場合
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    # 2回目以降は通常の属性参照で解決されるようにキャッシュ
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """未読み込みの公開名も含めて属性名を列挙"""
+    return sorted(set(globals()) | set(__all__))
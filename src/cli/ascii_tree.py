@@ -2,9 +2,14 @@
 
 ターミナルで表示可能なASCIIアート形式の家系図を生成します。
 """
+import io
+import unicodedata
+from fractions import Fraction
+from functools import lru_cache
 from typing import Any
 
 from inheritance_calculator_core.models.inheritance import (
+    Heir,
     HeritageRank,
     InheritanceResult,
 )
@@ -13,6 +18,74 @@ from inheritance_calculator_core.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _char_width(char: str) -> int:
+    """1文字の端末上の表示幅を取得
+
+    Args:
+        char: 文字
+
+    Returns:
+        int: 全角・絵文字は2、結合文字・異体字セレクタは0、それ以外は1
+    """
+    if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def _center(text: str, width: int) -> str:
+    """表示幅を考慮して文字列を中央寄せ
+
+    str.centerは文字数で幅を数えるため、日本語を含む行が右にずれる。
+
+    Args:
+        text: 対象の文字列
+        width: 全体の表示幅
+
+    Returns:
+        str: 左右を空白で埋めた文字列（幅を超える場合はそのまま）
+    """
+    padding = width - sum(map(_char_width, text))
+    if padding <= 0:
+        return text
+    left = padding // 2
+    return f"{' ' * left}{text}{' ' * (padding - left)}"
+
+
+@lru_cache(maxsize=256)
+def _share_text(share: Fraction, share_percentage: float) -> str:
+    """相続割合の表示文字列を取得
+
+    同じ相続分の相続人（子が複数いる場合など）や、シンプル版・詳細版の両方を描画する場合に
+    分数の文字列化を繰り返さないようキャッシュする。
+
+    Args:
+        share: 相続割合（分数）
+        share_percentage: 相続割合（%）
+
+    Returns:
+        str: 「1/4 (25.0%)」形式の文字列
+    """
+    return f"{share} ({share_percentage:.1f}%)"
+
+
+def _heirs_by_rank(result: InheritanceResult) -> dict[HeritageRank, list[Heir]]:
+    """相続人を順位ごとに1回の走査でまとめる
+
+    get_heirs_by_rankは呼び出しごとに相続人全体を走査するため、描画の最初に1回だけ振り分ける。
+
+    Args:
+        result: 相続計算結果
+
+    Returns:
+        dict[HeritageRank, list[Heir]]: 順位ごとの相続人（入力順を保持、該当なしは空リスト）
+    """
+    buckets: dict[HeritageRank, list[Heir]] = {rank: [] for rank in HeritageRank}
+    for heir in result.heirs:
+        buckets[heir.rank].append(heir)
+    return buckets
+
+
 class AsciiTreeGenerator:
     """ASCIIアート家系図生成クラス"""
 
@@ -33,64 +106,65 @@ class AsciiTreeGenerator:
         Returns:
             str: ASCIIアート家系図
         """
+        heirs_by_rank = _heirs_by_rank(result)
         lines = []
 
         # タイトル
         lines.append("=" * 60)
-        lines.append("家系図".center(60))
+        lines.append(_center("家系図", 60))
         lines.append("=" * 60)
         lines.append("")
 
         # 被相続人
         decedent_name = result.decedent.name
-        lines.append(f"        ⚰️  {decedent_name} （被相続人）".center(60))
+        lines.append(_center(f"        ⚰️  {decedent_name} （被相続人）", 60))
         lines.append("")
 
         # 配偶者
         if result.has_spouse:
-            spouse_heirs = result.get_heirs_by_rank(HeritageRank.SPOUSE)
+            spouse_heirs = heirs_by_rank[HeritageRank.SPOUSE]
             for heir in spouse_heirs:
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 lines.append(
-                    f"        💑 配偶者: {heir.person.name} - {share_text}".center(60)
+                    _center(f"        💑 配偶者: {heir.person.name} - {share_text}", 60)
                 )
             lines.append("")
 
         # 第1順位（子）
         if result.has_children:
-            lines.append("    ┌───────────── 子 ─────────────┐".center(60))
-            child_heirs = result.get_heirs_by_rank(HeritageRank.FIRST)
+            lines.append(_center("    ┌───────────── 子 ─────────────┐", 60))
+            child_heirs = heirs_by_rank[HeritageRank.FIRST]
             for heir in child_heirs:
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 # 代襲相続の判定
                 is_substitute = "(代襲)" if heir.is_substitution else ""
                 lines.append(
-                    f"    👶 {heir.person.name} {is_substitute} - {share_text}".center(
-                        60
+                    _center(
+                        f"    👶 {heir.person.name} {is_substitute} - {share_text}", 60
                     )
                 )
             lines.append("")
 
         # 第2順位（直系尊属）
         if result.has_parents:
-            lines.append("    ┌───────────── 直系尊属 ─────────────┐".center(60))
-            parent_heirs = result.get_heirs_by_rank(HeritageRank.SECOND)
+            lines.append(_center("    ┌───────────── 直系尊属 ─────────────┐", 60))
+            parent_heirs = heirs_by_rank[HeritageRank.SECOND]
             for heir in parent_heirs:
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
-                lines.append(f"    👴 {heir.person.name} - {share_text}".center(60))
+                share_text = _share_text(heir.share, heir.share_percentage)
+                lines.append(_center(f"    👴 {heir.person.name} - {share_text}", 60))
             lines.append("")
 
         # 第3順位（兄弟姉妹）
         if result.has_siblings:
-            lines.append("    ┌───────────── 兄弟姉妹 ─────────────┐".center(60))
-            sibling_heirs = result.get_heirs_by_rank(HeritageRank.THIRD)
+            lines.append(_center("    ┌───────────── 兄弟姉妹 ─────────────┐", 60))
+            sibling_heirs = heirs_by_rank[HeritageRank.THIRD]
             for heir in sibling_heirs:
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 # 代襲相続の判定
                 is_substitute = "(代襲)" if heir.is_substitution else ""
                 lines.append(
-                    f"    👫 {heir.person.name} {is_substitute} - {share_text}".center(
-                        60
+                    _center(
+                        f"    👫 {heir.person.name} {is_substitute} - {share_text}", 60
                     )
                 )
             lines.append("")
@@ -108,78 +182,84 @@ class AsciiTreeGenerator:
         Returns:
             str: 詳細なASCIIアート家系図
         """
-        lines = []
+        heirs_by_rank = _heirs_by_rank(result)
+        # 行リストを溜めてjoinせず、改行込みで直接書き込む
+        buf = io.StringIO()
 
         # ヘッダー
-        lines.append("╔" + "═" * 78 + "╗")
-        lines.append("║" + "相続関係図（詳細版）".center(78) + "║")
-        lines.append("╚" + "═" * 78 + "╝")
-        lines.append("")
+        buf.write(f"╔{'═' * 78}╗\n")
+        buf.write(f"║{_center('相続関係図（詳細版）', 78)}║\n")
+        buf.write(f"╚{'═' * 78}╝\n")
+        buf.write("\n")
 
         # 被相続人情報
         decedent_info = f"⚰️  {result.decedent.name} （被相続人）"
         if result.decedent.death_date:
             decedent_info += f" - 死亡日: {result.decedent.death_date}"
-        lines.append(decedent_info.center(80))
-        lines.append("│".center(80))
+        buf.write(_center(decedent_info, 80) + "\n")
+        buf.write(_center("│", 80) + "\n")
 
         # 配偶者
         if result.has_spouse:
-            lines.append("├─ 配偶者".center(80))
-            spouse_heirs = result.get_heirs_by_rank(HeritageRank.SPOUSE)
+            buf.write(_center("├─ 配偶者", 80) + "\n")
+            spouse_heirs = heirs_by_rank[HeritageRank.SPOUSE]
+            last = len(spouse_heirs) - 1
             for i, heir in enumerate(spouse_heirs):
-                connector = "└──" if i == len(spouse_heirs) - 1 else "├──"
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                connector = "├──" if i < last else "└──"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 person_line = f"   {connector} 💑 {heir.person.name}: {share_text}"
-                lines.append(person_line.center(80))
-            lines.append("")
+                buf.write(_center(person_line, 80) + "\n")
+            buf.write("\n")
 
         # 子（第1順位）
         if result.has_children:
-            lines.append("├─ 子（第1順位）".center(80))
-            child_heirs = result.get_heirs_by_rank(HeritageRank.FIRST)
+            buf.write(_center("├─ 子（第1順位）", 80) + "\n")
+            child_heirs = heirs_by_rank[HeritageRank.FIRST]
+            last = len(child_heirs) - 1
             for i, heir in enumerate(child_heirs):
-                connector = "└──" if i == len(child_heirs) - 1 else "├──"
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                connector = "├──" if i < last else "└──"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 suffix = " [代襲相続]" if heir.is_substitution else ""
                 person_line = (
                     f"   {connector} 👶 {heir.person.name}: {share_text}{suffix}"
                 )
-                lines.append(person_line.center(80))
-            lines.append("")
+                buf.write(_center(person_line, 80) + "\n")
+            buf.write("\n")
 
         # 直系尊属（第2順位）
         if result.has_parents:
-            lines.append("├─ 直系尊属（第2順位）".center(80))
-            parent_heirs = result.get_heirs_by_rank(HeritageRank.SECOND)
+            buf.write(_center("├─ 直系尊属（第2順位）", 80) + "\n")
+            parent_heirs = heirs_by_rank[HeritageRank.SECOND]
+            last = len(parent_heirs) - 1
             for i, heir in enumerate(parent_heirs):
-                connector = "└──" if i == len(parent_heirs) - 1 else "├──"
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                connector = "├──" if i < last else "└──"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 person_line = f"   {connector} 👴 {heir.person.name}: {share_text}"
-                lines.append(person_line.center(80))
-            lines.append("")
+                buf.write(_center(person_line, 80) + "\n")
+            buf.write("\n")
 
         # 兄弟姉妹（第3順位）
         if result.has_siblings:
-            lines.append("└─ 兄弟姉妹（第3順位）".center(80))
-            sibling_heirs = result.get_heirs_by_rank(HeritageRank.THIRD)
+            buf.write(_center("└─ 兄弟姉妹（第3順位）", 80) + "\n")
+            sibling_heirs = heirs_by_rank[HeritageRank.THIRD]
+            last = len(sibling_heirs) - 1
             for i, heir in enumerate(sibling_heirs):
-                connector = "└──" if i == len(sibling_heirs) - 1 else "├──"
-                share_text = f"{heir.share} ({heir.share_percentage:.1f}%)"
+                connector = "├──" if i < last else "└──"
+                share_text = _share_text(heir.share, heir.share_percentage)
                 suffix = " [代襲相続]" if heir.is_substitution else ""
                 person_line = (
                     f"   {connector} 👫 {heir.person.name}: {share_text}{suffix}"
                 )
-                lines.append(person_line.center(80))
-            lines.append("")
+                buf.write(_center(person_line, 80) + "\n")
+            buf.write("\n")
 
         # フッター
-        lines.append("")
-        lines.append("─" * 80)
-        lines.append(f"相続人総数: {result.total_heirs}名".center(80))
-        lines.append("─" * 80)
+        buf.write("\n")
+        buf.write("─" * 80 + "\n")
+        buf.write(_center(f"相続人総数: {result.total_heirs}名", 80) + "\n")
+        buf.write("─" * 80)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def check_complexity(self, result: InheritanceResult) -> dict[str, Any]:
         """家系図の複雑さをチェック
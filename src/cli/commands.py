@@ -2,10 +2,13 @@
 
 各サブコマンドの実装を提供します。
 """
+import json
 import sys
 from argparse import Namespace
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from inheritance_calculator_core.models.inheritance import InheritanceResult
 from inheritance_calculator_core.models.person import Person
@@ -28,9 +31,154 @@ from src.cli.display import display_error, display_info, display_result
 from src.cli.family_tree_generator import FamilyTreeGenerator
 from src.cli.report_generator import ReportGenerator
 
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準ライブラリのjsonを使用
+    orjson = None  # type: ignore[assignment]
+
 console = Console()
 
 
+def _read_json(path: Path) -> Any:
+    """JSONファイルを読み込み
+
+    orjsonがインストールされていればそれで解析する。
+    orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラスのため、呼び出し側の例外処理は共通。
+
+    Args:
+        path: JSONファイルのパス
+
+    Returns:
+        Any: 解析結果
+    """
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(data: Any, path: Path) -> None:
+    """データをインデント付きJSONとしてUTF-8で書き出し
+
+    Args:
+        data: 書き出すデータ
+        path: 出力ファイルのパス
+    """
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class Pedigree(NamedTuple):
+    """入力ファイルから読み込んだ家族構成"""
+
+    decedent: Person
+    spouses: list[Person]
+    children: list[Person]
+    parents: list[Person]
+    siblings: list[Person]
+    renounced: list[Person]
+    sibling_blood_types: dict[PersonID, BloodType]
+
+
+@lru_cache(maxsize=16)
+def _read_pedigree_data(path: str, mtime_ns: int) -> Any:
+    """家族構成JSONを解析（パスと更新日時をキーにキャッシュ）
+
+    ファイルが更新されると更新日時が変わるため、キャッシュは自然に無効化される。
+    Personは呼び出しごとに生成する（連絡先の登録などで変更されるため共有しない）。
+
+    Args:
+        path: JSONファイルのパス
+        mtime_ns: ファイルの更新日時（ナノ秒）
+
+    Returns:
+        Any: 解析結果
+    """
+    return _read_json(Path(path))
+
+
+def _optional_date(value: str | None) -> date | None:
+    """ISO形式の日付文字列をdateに変換（未指定はNone）"""
+    return date.fromisoformat(value) if value else None
+
+
+def _person_from_json(person_data: dict[str, Any]) -> Person:
+    """JSONの人物情報からPersonを作成
+
+    Args:
+        person_data: 人物情報
+
+    Returns:
+        Person: 相続人候補
+    """
+    return Person(
+        name=person_data["name"],
+        is_alive=person_data.get("is_alive", True),
+        birth_date=_optional_date(person_data.get("birth_date")),
+        death_date=_optional_date(person_data.get("death_date")),
+    )
+
+
+def _load_pedigree_json(path: Path) -> Pedigree:
+    """JSONファイルから家族構成を読み込み
+
+    Args:
+        path: JSONファイルのパス
+
+    Returns:
+        Pedigree: 家族構成
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        json.JSONDecodeError: JSONの解析に失敗した場合
+        KeyError: 必須フィールドが不足している場合
+    """
+    path = Path(path)
+    data = _read_pedigree_data(str(path), path.stat().st_mtime_ns)
+
+    # 被相続人の作成
+    decedent_data = data["decedent"]
+    decedent = Person(
+        name=decedent_data["name"],
+        is_decedent=True,
+        is_alive=False,
+        birth_date=_optional_date(decedent_data.get("birth_date")),
+        death_date=date.fromisoformat(decedent_data["death_date"]),
+    )
+
+    # 相続人候補の作成
+    spouses = [_person_from_json(d) for d in data.get("spouses", [])]
+    children = [_person_from_json(d) for d in data.get("children", [])]
+    parents = [_person_from_json(d) for d in data.get("parents", [])]
+
+    siblings = []
+    sibling_blood_types: dict[PersonID, BloodType] = {}
+    for sibling_data in data.get("siblings", []):
+        sibling = _person_from_json(sibling_data)
+        siblings.append(sibling)
+
+        # 血縁タイプの設定
+        blood_type_str = sibling_data.get("blood_type", "full")
+        sibling_blood_types[sibling.id] = (
+            BloodType.FULL if blood_type_str == "full" else BloodType.HALF
+        )
+
+    # 相続放棄者の名前リストから人物を特定（同名の場合は最初の人物）
+    renounced = []
+    all_persons = spouses + children + parents + siblings
+    for name in data.get("renounced", []):
+        person = next((p for p in all_persons if p.name == name), None)
+        if person:
+            renounced.append(person)
+
+    return Pedigree(
+        decedent, spouses, children, parents, siblings, renounced, sibling_blood_types
+    )
+
+
 def handle_post_calculation(
     result: InheritanceResult,
     collect_contact: bool = True,
@@ -170,103 +318,17 @@ def calculate_from_file(
     Returns:
         終了コード
     """
-    import json
-    from datetime import date
-
-    from inheritance_calculator_core.models.person import Person
-    from inheritance_calculator_core.models.relationship import BloodType
-
     try:
-        # JSONファイルを読み込み
-        with open(input_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # 被相続人の作成
-        decedent_data = data["decedent"]
-        decedent = Person(
-            name=decedent_data["name"],
-            is_decedent=True,
-            is_alive=False,
-            birth_date=(
-                date.fromisoformat(decedent_data.get("birth_date"))
-                if decedent_data.get("birth_date")
-                else None
-            ),
-            death_date=date.fromisoformat(decedent_data["death_date"]),
-        )
-
-        # 相続人候補の作成
-        spouses = []
-        for spouse_data in data.get("spouses", []):
-            spouse = Person(
-                name=spouse_data["name"],
-                is_alive=spouse_data.get("is_alive", True),
-                birth_date=date.fromisoformat(spouse_data.get("birth_date"))
-                if spouse_data.get("birth_date")
-                else None,
-                death_date=date.fromisoformat(spouse_data.get("death_date"))
-                if spouse_data.get("death_date")
-                else None,
-            )
-            spouses.append(spouse)
-
-        children = []
-        for child_data in data.get("children", []):
-            child = Person(
-                name=child_data["name"],
-                is_alive=child_data.get("is_alive", True),
-                birth_date=date.fromisoformat(child_data.get("birth_date"))
-                if child_data.get("birth_date")
-                else None,
-                death_date=date.fromisoformat(child_data.get("death_date"))
-                if child_data.get("death_date")
-                else None,
-            )
-            children.append(child)
-
-        parents = []
-        for parent_data in data.get("parents", []):
-            parent = Person(
-                name=parent_data["name"],
-                is_alive=parent_data.get("is_alive", True),
-                birth_date=date.fromisoformat(parent_data.get("birth_date"))
-                if parent_data.get("birth_date")
-                else None,
-                death_date=date.fromisoformat(parent_data.get("death_date"))
-                if parent_data.get("death_date")
-                else None,
-            )
-            parents.append(parent)
-
-        siblings = []
-        sibling_blood_types: dict[PersonID, BloodType] = {}
-        for sibling_data in data.get("siblings", []):
-            sibling = Person(
-                name=sibling_data["name"],
-                is_alive=sibling_data.get("is_alive", True),
-                birth_date=date.fromisoformat(sibling_data.get("birth_date"))
-                if sibling_data.get("birth_date")
-                else None,
-                death_date=date.fromisoformat(sibling_data.get("death_date"))
-                if sibling_data.get("death_date")
-                else None,
-            )
-            siblings.append(sibling)
-
-            # 血縁タイプの設定
-            blood_type_str = sibling_data.get("blood_type", "full")
-            sibling_blood_types[sibling.id] = (
-                BloodType.FULL if blood_type_str == "full" else BloodType.HALF
-            )
-
-        # 相続放棄者の名前リストを取得
-        renounced_names = data.get("renounced", [])
-        renounced = []
-        all_persons = spouses + children + parents + siblings
-        for name in renounced_names:
-            person = next((p for p in all_persons if p.name == name), None)
-            if person:
-                renounced.append(person)
+        # JSONファイルから家族構成を読み込み
+        (
+            decedent,
+            spouses,
+            children,
+            parents,
+            siblings,
+            renounced,
+            sibling_blood_types,
+        ) = _load_pedigree_json(input_file)
 
         # 相続計算の実行
         calculator = InheritanceCalculator()
@@ -426,8 +488,6 @@ def export_result(result: Any, output_file: Path) -> None:
         result: 相続計算結果
         output_file: 出力ファイルパス
     """
-    import json
-
     # ファイル拡張子で出力形式を判定
     file_ext = output_file.suffix.lower()
 
@@ -452,8 +512,7 @@ def export_result(result: Any, output_file: Path) -> None:
             "calculation_basis": result.calculation_basis,
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        _write_json(output_data, output_file)
 
     elif file_ext == ".md":
         # Markdown形式
@@ -546,11 +605,8 @@ def validate_command(args: Namespace) -> int:
     Returns:
         終了コード
     """
-    import json
-
     try:
-        with open(args.input_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(args.input_file)
 
         # 必須フィールドの検証
         required_fields = ["decedent"]
@@ -673,118 +729,20 @@ def tree_command(args: Namespace) -> int:
     try:
         # 入力ファイルから計算
         if args.input_file.suffix.lower() == ".csv":
-            (
-                decedent,
-                spouses,
-                children,
-                parents,
-                siblings,
-                renounced,
-                sibling_blood_types,
-            ) = CSVParser.parse_csv_file(args.input_file)
+            pedigree = Pedigree(*CSVParser.parse_csv_file(args.input_file))
         else:
-            # JSON形式の読み込み（calculate_from_fileと同様）
-            import json
-            from datetime import date
-
-            from inheritance_calculator_core.models.person import Person
-            from inheritance_calculator_core.models.relationship import BloodType
-
-            with open(args.input_file, encoding="utf-8") as f:
-                data = json.load(f)
-
-            decedent_data = data["decedent"]
-            decedent = Person(
-                name=decedent_data["name"],
-                is_decedent=True,
-                is_alive=False,
-                birth_date=date.fromisoformat(decedent_data.get("birth_date"))
-                if decedent_data.get("birth_date")
-                else None,
-                death_date=date.fromisoformat(decedent_data["death_date"]),
-            )
-
-            spouses = []
-            for spouse_data in data.get("spouses", []):
-                spouse = Person(
-                    name=spouse_data["name"],
-                    is_alive=spouse_data.get("is_alive", True),
-                    birth_date=date.fromisoformat(spouse_data.get("birth_date"))
-                    if spouse_data.get("birth_date")
-                    else None,
-                    death_date=date.fromisoformat(spouse_data.get("death_date"))
-                    if spouse_data.get("death_date")
-                    else None,
-                )
-                spouses.append(spouse)
-
-            children = []
-            for child_data in data.get("children", []):
-                child = Person(
-                    name=child_data["name"],
-                    is_alive=child_data.get("is_alive", True),
-                    birth_date=date.fromisoformat(child_data.get("birth_date"))
-                    if child_data.get("birth_date")
-                    else None,
-                    death_date=date.fromisoformat(child_data.get("death_date"))
-                    if child_data.get("death_date")
-                    else None,
-                )
-                children.append(child)
-
-            parents = []
-            for parent_data in data.get("parents", []):
-                parent = Person(
-                    name=parent_data["name"],
-                    is_alive=parent_data.get("is_alive", True),
-                    birth_date=date.fromisoformat(parent_data.get("birth_date"))
-                    if parent_data.get("birth_date")
-                    else None,
-                    death_date=date.fromisoformat(parent_data.get("death_date"))
-                    if parent_data.get("death_date")
-                    else None,
-                )
-                parents.append(parent)
-
-            siblings = []
-            sibling_blood_types_json: dict[PersonID, BloodType] = {}
-            for sibling_data in data.get("siblings", []):
-                sibling = Person(
-                    name=sibling_data["name"],
-                    is_alive=sibling_data.get("is_alive", True),
-                    birth_date=date.fromisoformat(sibling_data.get("birth_date"))
-                    if sibling_data.get("birth_date")
-                    else None,
-                    death_date=date.fromisoformat(sibling_data.get("death_date"))
-                    if sibling_data.get("death_date")
-                    else None,
-                )
-                siblings.append(sibling)
-                blood_type_str = sibling_data.get("blood_type", "full")
-                sibling_blood_types_json[sibling.id] = (
-                    BloodType.FULL if blood_type_str == "full" else BloodType.HALF
-                )
-
-            renounced_names = data.get("renounced", [])
-            renounced = []
-            all_persons = spouses + children + parents + siblings
-            for name in renounced_names:
-                person = next((p for p in all_persons if p.name == name), None)
-                if person:
-                    renounced.append(person)
+            pedigree = _load_pedigree_json(args.input_file)
 
         # 相続計算の実行
         calculator = InheritanceCalculator()
-        # CSVとJSONで異なる変数名を使用しているため統合
-        final_sibling_blood_types = sibling_blood_types_json if 'sibling_blood_types_json' in locals() else sibling_blood_types
         result = calculator.calculate(
-            decedent=decedent,
-            spouses=spouses,
-            children=children,
-            parents=parents,
-            siblings=siblings,
-            renounced=renounced if renounced else None,
-            sibling_blood_types=final_sibling_blood_types if final_sibling_blood_types else None,
+            decedent=pedigree.decedent,
+            spouses=pedigree.spouses,
+            children=pedigree.children,
+            parents=pedigree.parents,
+            siblings=pedigree.siblings,
+            renounced=pedigree.renounced or None,
+            sibling_blood_types=pedigree.sibling_blood_types or None,
         )
 
         # 家系図の生成
@@ -3,8 +3,9 @@
 CSV形式から相続情報を読み込む機能を提供します。
 """
 import csv
+import re
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 
 from inheritance_calculator_core.models.person import Person
@@ -12,6 +13,16 @@ from inheritance_calculator_core.models.relationship import BloodType
 from inheritance_calculator_core.models.value_objects import PersonID
 from inheritance_calculator_core.utils.exceptions import ValidationError
 
+# 対応する日付形式（YYYY-MM-DD、YYYY/MM/DD、YYYY年MM月DD日）を1つにまとめたパターン
+# 区切り文字の混在（2025-01/15 など）や全角数字は従来どおり受け付けない
+_DATE_PATTERN = re.compile(
+    r"(\d{4})(?:-(\d{1,2})-(\d{1,2})|/(\d{1,2})/(\d{1,2})|年(\d{1,2})月(\d{1,2})日)",
+    re.ASCII,
+)
+
+# blood_type列の値と血縁タイプの対応
+_BLOOD_TYPES = {"full": BloodType.FULL, "half": BloodType.HALF}
+
 
 @dataclass
 class CSVRow:
@@ -42,14 +53,15 @@ class CSVParser:
         if not date_str or date_str.strip() == "":
             return None
 
-        # 複数の日付フォーマットに対応
-        formats = ["%Y-%m-%d", "%Y/%m/%d", "%Y年%m月%d日"]
-
-        for fmt in formats:
+        # 3形式を1回の照合で判定（strptimeを形式ごとに試して例外で落ちるより軽い）
+        match = _DATE_PATTERN.fullmatch(date_str.strip())
+        if match:
+            year, *parts = match.groups()
+            month, day = (int(part) for part in parts if part is not None)
             try:
-                return datetime.strptime(date_str.strip(), fmt).date()
+                return date(int(year), month, day)
             except ValueError:
-                continue
+                pass
 
         raise ValueError(f"無効な日付形式です: {date_str}")
 
@@ -158,6 +170,14 @@ class CSVParser:
         renounced: list[Person] = []
         sibling_blood_types: dict[PersonID, BloodType] = {}
 
+        # 役割ごとの振り分け先（if/elifの連鎖ではなく1回の辞書引きで分類）
+        role_groups = {
+            "spouse": spouses,
+            "child": children,
+            "parent": parents,
+            "sibling": siblings,
+        }
+
         for row in rows:
             if row.role == "decedent":
                 continue
@@ -170,29 +190,19 @@ class CSVParser:
             )
 
             # 役割ごとに分類
-            if row.role == "spouse":
-                spouses.append(person)
-            elif row.role == "child":
-                children.append(person)
-            elif row.role == "parent":
-                parents.append(person)
-            elif row.role == "sibling":
-                siblings.append(person)
-                # 血縁タイプの設定
-                if row.blood_type:
-                    if row.blood_type == "full":
-                        sibling_blood_types[person.id] = BloodType.FULL
-                    elif row.blood_type == "half":
-                        sibling_blood_types[person.id] = BloodType.HALF
-                    else:
-                        raise ValidationError(
-                            f"無効な血縁タイプです（{row.name}）: {row.blood_type}"
-                        )
-                else:
-                    # デフォルトは全血
-                    sibling_blood_types[person.id] = BloodType.FULL
-            else:
+            group = role_groups.get(row.role)
+            if group is None:
                 raise ValidationError(f"無効な役割です: {row.role}")
+            group.append(person)
+
+            if row.role == "sibling":
+                # 血縁タイプの設定（デフォルトは全血）
+                blood_type = _BLOOD_TYPES.get(row.blood_type or "full")
+                if blood_type is None:
+                    raise ValidationError(
+                        f"無効な血縁タイプです（{row.name}）: {row.blood_type}"
+                    )
+                sibling_blood_types[person.id] = blood_type
 
             # 相続放棄の記録
             if row.is_renounced:
@@ -4,7 +4,7 @@ from fractions import Fraction
 
 import pytest
 
-from src.cli.ascii_tree import AsciiTreeGenerator
+from src.cli.ascii_tree import AsciiTreeGenerator, _center
 from inheritance_calculator_core.models.person import Person, Gender
 from inheritance_calculator_core.models.inheritance import InheritanceResult, Heir, HeritageRank
 
@@ -220,3 +220,28 @@ class TestAsciiTreeGenerator:
         assert "⚰️" in tree  # 被相続人
         assert "💑" in tree  # 配偶者
         assert "👶" in tree  # 子
+
+    def test_detailed_tree_title_box_is_aligned(self, generator, simple_result):
+        """全角文字を含むタイトルでも枠線の幅が揃うかテスト"""
+        tree = generator.generate_detailed_tree(simple_result)
+
+        title_line = tree.split("\n")[1]
+        assert title_line == "║" + _center("相続関係図（詳細版）", 78) + "║"
+        assert len(title_line) == 80 - len("相続関係図（詳細版）")
+
+
+class TestCenter:
+    """表示幅を考慮した中央寄せのテスト"""
+
+    @pytest.mark.parametrize(
+        ("text", "width", "expected"),
+        [
+            ("abc", 7, "  abc  "),
+            ("家系図", 10, "  家系図  "),
+            ("⚰️ 山田", 10, "  ⚰️ 山田  "),
+            ("相続人総数", 8, "相続人総数"),
+        ],
+    )
+    def test_center(self, text, width, expected):
+        """全角文字は2、異体字セレクタは0として幅を数える"""
+        assert _center(text, width) == expected
@@ -1,11 +1,14 @@
 """CLIコマンドのテスト"""
 import json
+import os
 from pathlib import Path
 from datetime import date
 import pytest
 from unittest.mock import Mock, patch
 
 from src.cli.commands import (
+    _load_pedigree_json,
+    _read_pedigree_data,
     calculate_from_file,
     export_result,
     validate_command,
@@ -159,6 +162,43 @@ class TestCalculateFromFile:
         assert "必須フィールド" in captured.out
 
 
+class TestLoadPedigreeJson:
+    """_load_pedigree_json関数のテスト"""
+
+    def test_load_pedigree_json(self, sample_input_file):
+        """JSONファイルから家族構成を読み込む"""
+        pedigree = _load_pedigree_json(sample_input_file)
+
+        assert pedigree.decedent.name == "山田太郎"
+        assert pedigree.decedent.is_decedent is True
+        assert pedigree.decedent.death_date == date(2025, 6, 15)
+        assert [p.name for p in pedigree.spouses] == ["山田花子"]
+        assert [p.birth_date for p in pedigree.children] == [date(1980, 5, 20)]
+        assert pedigree.renounced == []
+
+    def test_reload_reuses_parse_but_not_persons(self, sample_input_file):
+        """同じファイルの再読み込みは解析を省略し、Personは作り直す"""
+        _read_pedigree_data.cache_clear()
+
+        first = _load_pedigree_json(sample_input_file)
+        second = _load_pedigree_json(sample_input_file)
+
+        assert _read_pedigree_data.cache_info().hits == 1
+        assert first.decedent is not second.decedent
+        assert first.spouses[0].name == second.spouses[0].name
+
+    def test_modified_file_is_reparsed(self, sample_input_file):
+        """ファイルが更新されると再解析される"""
+        _load_pedigree_json(sample_input_file)
+
+        data = json.loads(sample_input_file.read_text(encoding="utf-8"))
+        data["decedent"]["name"] = "山田次郎"
+        sample_input_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.utime(sample_input_file, ns=(0, sample_input_file.stat().st_mtime_ns + 1_000_000))
+
+        assert _load_pedigree_json(sample_input_file).decedent.name == "山田次郎"
+
+
 class TestExportResult:
     """export_result関数のテスト"""
 
@@ -200,6 +240,17 @@ class TestExportResult:
             assert "/" in heir["share"]  # 分数形式
             assert isinstance(heir["share_percentage"], (int, float))
 
+    def test_export_result_json_same_without_orjson(self, sample_result, tmp_path, monkeypatch):
+        """orjsonの有無で出力内容が変わらない"""
+        with_orjson = tmp_path / "with_orjson.json"
+        export_result(sample_result, with_orjson)
+
+        monkeypatch.setattr("src.cli.commands.orjson", None)
+        without_orjson = tmp_path / "without_orjson.json"
+        export_result(sample_result, without_orjson)
+
+        assert with_orjson.read_bytes() == without_orjson.read_bytes()
+
 
 class TestValidateCommand:
     """validate_command関数のテスト"""
@@ -33,6 +33,17 @@ class TestCSVParser:
         with pytest.raises(ValueError, match="無効な日付形式です"):
             CSVParser.parse_date("2025-13-01")  # 無効な月
 
+    @pytest.mark.parametrize("date_str", ["2025-01/15", "２０２５-０１-１５", "2025年1月5", "2025-02-30"])
+    def test_parse_date_rejects_mixed_or_invalid(self, date_str: str) -> None:
+        """区切りの混在・全角数字・存在しない日付は受け付けない"""
+        with pytest.raises(ValueError, match="無効な日付形式です"):
+            CSVParser.parse_date(date_str)
+
+    def test_parse_date_single_digit_month_and_day(self) -> None:
+        """月日は1桁でもパースできる"""
+        assert CSVParser.parse_date("2025/1/5") == date(2025, 1, 5)
+        assert CSVParser.parse_date("2025年1月5日") == date(2025, 1, 5)
+
     def test_parse_bool_japanese(self) -> None:
         """日本語のboolean値"""
         assert CSVParser.parse_bool("はい") is True
@@ -176,3 +176,37 @@ class TestMain:
 
         captured = capsys.readouterr()
         assert "中断" in captured.out
+
+
+class TestPackageLazyImport:
+    """src.cliパッケージの遅延インポートのテスト"""
+
+    def test_import_does_not_load_main(self):
+        """パッケージのimportだけではmain/displayを読み込まない"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, src.cli; "
+            "print('src.cli.main' in sys.modules, 'src.cli.display' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.split() == ["False", "False"]
+
+    def test_public_names_resolve_lazily(self):
+        """公開名は定義元の関数に解決される"""
+        import src.cli
+        from src.cli import display
+        from src.cli.main import cli_entry_point
+
+        assert src.cli.cli_entry_point is cli_entry_point
+        assert src.cli.display_result is display.display_result
+
+    def test_unknown_attribute_raises(self):
+        """公開名以外はAttributeError"""
+        import src.cli
+
+        with pytest.raises(AttributeError):
+            src.cli.not_a_public_name